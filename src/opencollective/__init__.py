@@ -1,7 +1,29 @@
 """OpenCollective Python client."""
 
-from opencollective.auth import OAuth2Handler
-from opencollective.client import OpenCollectiveClient
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from opencollective.auth import OAuth2Handler
+    from opencollective.client import OpenCollectiveClient
 
 __version__ = "0.2.1"
 __all__ = ["OpenCollectiveClient", "OAuth2Handler"]
+
+
+def __getattr__(name: str):
+    """Import public classes on first access (PEP 562).
+
+    Both classes pull in requests/urllib3, which would otherwise be paid for
+    by every CLI invocation, including `oc --help`.
+    """
+    if name == "OpenCollectiveClient":
+        from opencollective.client import OpenCollectiveClient
+
+        globals()[name] = OpenCollectiveClient
+        return OpenCollectiveClient
+    if name == "OAuth2Handler":
+        from opencollective.auth import OAuth2Handler
+
+        globals()[name] = OAuth2Handler
+        return OAuth2Handler
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
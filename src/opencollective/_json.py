@@ -0,0 +1,71 @@
+"""JSON helpers that use orjson when available, falling back to the stdlib."""
+
+import json
+import os
+from typing import Any
+
+# Optional fast JSON (de)serialization
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize JSON from bytes or str.
+
+    Args:
+        data: Raw JSON document, e.g. an HTTP response body.
+
+    Returns:
+        The decoded Python object.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to compact JSON bytes.
+
+    Args:
+        obj: Object to serialize, e.g. a GraphQL request body.
+
+    Returns:
+        UTF-8 encoded JSON without insignificant whitespace.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def load_file(path: str) -> Any:
+    """Read and deserialize a small JSON file, such as a saved token.
+
+    The file is read as raw bytes from an unbuffered descriptor, skipping
+    the text-mode wrapper and decoding that open() would set up.
+
+    Args:
+        path: Path to the JSON file.
+
+    Returns:
+        The decoded Python object.
+
+    Raises:
+        OSError: If the file cannot be opened or read.
+    """
+    flags = os.O_RDONLY | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags)
+    try:
+        size = os.fstat(fd).st_size
+        data = b""
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+    finally:
+        os.close(fd)
+    return loads(data)
@@ -1,42 +1,66 @@
 """OpenCollective CLI."""
 
-import functools
-import json
 import os
 import sys
+from typing import TYPE_CHECKING
 
 import click
 
-from .client import OpenCollectiveClient
+from . import _json
+
+if TYPE_CHECKING:
+    from .client import OpenCollectiveClient
 
 TOKEN_FILE = os.path.expanduser("~/.config/opencollective/token.json")
 
+_STATUS_ICONS = {
+    "PENDING": "\u23f3",
+    "APPROVED": "\u2713",
+    "PAID": "\U0001f4b0",
+    "REJECTED": "\u2717",
+}
+
 
-def get_client() -> OpenCollectiveClient:
+def get_client() -> "OpenCollectiveClient":
     """Get an authenticated client from saved token."""
+    # Imported here so that --help/--version do not load requests
+    from .client import OpenCollectiveClient
+
     if not os.path.exists(TOKEN_FILE):
         click.echo(f"Error: No token found at {TOKEN_FILE}", err=True)
         click.echo("Run 'oc auth' to authenticate first.", err=True)
         sys.exit(1)
 
-    with open(TOKEN_FILE) as f:
-        token_data = json.load(f)
+    token_data = _json.load_file(TOKEN_FILE)
 
     return OpenCollectiveClient(access_token=token_data["access_token"])
 
 
-def handle_errors(func):
-    """Decorator that catches exceptions and exits with an error message."""
+class _ErrorHandlingGroup(click.Group):
+    """Command group that reports unexpected errors from any subcommand.
+
+    Errors are caught once here rather than by wrapping every command, so
+    users see a short message and exit status 1 instead of a traceback.
+    """
 
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
+    def invoke(self, ctx: click.Context):
         try:
-            return func(*args, **kwargs)
+            return super().invoke(ctx)
+        except (click.ClickException, click.exceptions.Exit, click.Abort):
+            raise
         except Exception as e:
             click.echo(f"Error: {e}", err=True)
             sys.exit(1)
 
-    return wrapper
+
+def _format_cents(cents: int) -> str:
+    """Format an amount in cents as a decimal string, e.g. 32550 -> "325.50".
+
+    Integer arithmetic avoids float rounding on currency amounts.
+    """
+    dollars, rem = divmod(abs(cents), 100)
+    sign = "-" if cents < 0 else ""
+    return f"{sign}{dollars}.{rem:02d}"
 
 
 def _echo_expense_created(collective: str, expense: dict) -> None:
@@ -46,7 +70,7 @@ def _echo_expense_created(collective: str, expense: dict) -> None:
     click.echo(f"  View: https://opencollective.com/{collective}/expenses/{legacy_id}")
 
 
-@click.group()
+@click.group(cls=_ErrorHandlingGroup)
 @click.version_option()
 def cli():
     """OpenCollective CLI - manage expenses from the command line."""
@@ -61,7 +85,6 @@ def cli():
     "-c", "--collective", required=True, help="Collective slug (e.g., policyengine)"
 )
 @click.option("-t", "--tag", multiple=True, help="Tags for the expense")
-@handle_errors
 def reimbursement(description: str, amount: float, receipt: str, collective: str, tag):
     """Submit a reimbursement expense with a receipt.
 
@@ -92,7 +115,6 @@ def reimbursement(description: str, amount: float, receipt: str, collective: str
 )
 @click.option("-i", "--invoice", type=click.Path(exists=True), help="Invoice file")
 @click.option("-t", "--tag", multiple=True, help="Tags for the expense")
-@handle_errors
 def invoice(description: str, amount: float, collective: str, invoice: str | None, tag):
     """Submit an invoice expense.
 
@@ -122,7 +144,6 @@ def invoice(description: str, amount: float, collective: str, invoice: str | Non
 @click.option("--pending", is_flag=True, help="Show only pending expenses")
 @click.option("--mine", is_flag=True, help="Show only my expenses")
 @click.option("-n", "--limit", default=20, help="Number of expenses to show")
-@handle_errors
 def expenses(collective: str, pending: bool, mine: bool, limit: int):
     """List expenses for a collective.
 
@@ -132,42 +153,41 @@ def expenses(collective: str, pending: bool, mine: bool, limit: int):
     client = get_client()
 
     status_filter = "PENDING" if pending else None
-    result = client.get_expenses(collective, status=status_filter, limit=limit)
-    nodes = result.get("nodes", [])
-
+    payee_slug = None
     if mine:
-        me = client.get_me()
-        my_slug = me.get("slug")
-        nodes = [e for e in nodes if e.get("payee", {}).get("slug") == my_slug]
+        payee_slug = client.get_me().get("slug")
+        if not payee_slug:
+            # Without a slug the filter would be dropped and every expense
+            # listed, so refuse rather than show someone else's expenses.
+            click.echo("Error: Could not determine your account slug", err=True)
+            sys.exit(1)
+    result = client.get_expenses(
+        collective, status=status_filter, limit=limit, payee_slug=payee_slug
+    )
+    nodes = result.get("nodes", [])
 
     if not nodes:
         click.echo("No expenses found.")
         return
 
-    status_icons = {
-        "PENDING": "\u23f3",
-        "APPROVED": "\u2713",
-        "PAID": "\U0001f4b0",
-        "REJECTED": "\u2717",
-    }
-
-    click.echo(f"Found {len(nodes)} expense(s):\n")
+    # Build the whole listing and write it once; echoing per line dominates
+    # the runtime for large --limit values.
+    icon_for = _STATUS_ICONS.get
+    lines = [f"Found {len(nodes)} expense(s):\n"]
     for exp in nodes:
-        amount = exp.get("amount", 0) / 100
         status = exp.get("status", "UNKNOWN")
-        desc = exp.get("description", "No description")
-        legacy_id = exp.get("legacyId", "?")
-        payee = exp.get("payee", {}).get("name", "Unknown")
-        icon = status_icons.get(status, "?")
-
-        click.echo(f"  {icon} #{legacy_id} ${amount:.2f} - {desc}")
-        click.echo(f"     Payee: {payee} | Status: {status}")
-        click.echo()
+        payee = (exp.get("payee") or {}).get("name", "Unknown")
+        lines.append(
+            f"  {icon_for(status, '?')} #{exp.get('legacyId', '?')} "
+            f"${_format_cents(exp.get('amount', 0))} - "
+            f"{exp.get('description', 'No description')}\n"
+            f"     Payee: {payee} | Status: {status}\n"
+        )
+    click.echo("\n".join(lines))
 
 
 @cli.command()
 @click.argument("expense_id")
-@handle_errors
 def delete(expense_id: str):
     """Delete an expense (draft/pending only).
 
@@ -181,7 +201,6 @@ def delete(expense_id: str):
 
 @cli.command()
 @click.argument("expense_id")
-@handle_errors
 def approve(expense_id: str):
     """Approve a pending expense (requires admin permissions).
 
@@ -197,7 +216,6 @@ def approve(expense_id: str):
 @cli.command()
 @click.argument("expense_id")
 @click.option("-m", "--message", help="Rejection message")
-@handle_errors
 def reject(expense_id: str, message: str | None):
     """Reject a pending expense (requires admin permissions).
 
@@ -211,30 +229,28 @@ def reject(expense_id: str, message: str | None):
 
 
 @cli.command()
-@handle_errors
 def me():
     """Show current authenticated user."""
     client = get_client()
-    me_data = client.get_me()
+    me_data, methods = client.get_me_with_payout_methods()
     click.echo(f"Logged in as: {me_data.get('name')} (@{me_data.get('slug')})")
 
-    methods = client.get_payout_methods(me_data["slug"])
     if methods:
-        click.echo("\nPayout methods:")
-        for m in methods:
-            click.echo(f"  - {m['type']}: {m['id']}")
+        lines = ["\nPayout methods:"]
+        lines.extend(f"  - {m['type']}: {m['id']}" for m in methods)
+        click.echo("\n".join(lines))
 
 
 @cli.command()
 @click.option("--client-id", prompt=True, help="OAuth2 client ID")
 @click.option("--client-secret", prompt=True, hide_input=True, help="OAuth2 secret")
-@handle_errors
 def auth(client_id: str, client_secret: str):
     """Authenticate with OpenCollective OAuth2.
 
     Get credentials at: https://opencollective.com/applications
     """
     from .auth import OAuth2Handler
+    from .client import OpenCollectiveClient
 
     handler = OAuth2Handler(
         client_id=client_id,
@@ -1,13 +1,30 @@
 """OpenCollective API client."""
 
+import functools
+import hashlib
+import importlib.util
+import io
 import json
 import mimetypes
 import os
 import tempfile
+import textwrap
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Any, BinaryIO
+from itertools import islice
+from typing import TYPE_CHECKING, Any, BinaryIO, Final, Protocol, cast
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import select_proxy
+from urllib3.fields import RequestField
+from urllib3.filepost import choose_boundary
+from urllib3.util.retry import Retry
+
+from . import __version__, _json
+from .types import Expense, ExpensesPage
 
 # Optional PDF conversion
 try:
@@ -17,11 +34,176 @@ try:
 except (ImportError, OSError):
     HAS_WEASYPRINT = False
 
-API_URL = "https://api.opencollective.com/graphql/v2"
+# httpx is only imported when a client selects transport="httpx"
+if TYPE_CHECKING:
+    import httpx
+
+API_URL: Final = "https://api.opencollective.com/graphql/v2"
 # File uploads must go through the frontend proxy due to infrastructure issues
 # with multipart handling on the direct API endpoint.
 # See: https://github.com/opencollective/opencollective-api/issues/11293
-UPLOAD_API_URL = "https://opencollective.com/api/graphql/v2"
+UPLOAD_API_URL: Final = "https://opencollective.com/api/graphql/v2"
+
+# How long payout methods fetched for a payee are reused, in seconds
+PAYOUT_METHODS_TTL = 300
+
+# Upper bound on concurrent receipt uploads for multi-item expenses
+MAX_UPLOAD_WORKERS = 8
+
+# Conditional-request cache for read-only queries whose results rarely change
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "opencollective",
+)
+# How long a cache entry may be revalidated before it is fetched afresh and
+# older entries are removed, in seconds
+CACHE_TTL = 7 * 24 * 60 * 60
+
+# GraphQL documents are built once at import time. Leading indentation is
+# stripped to keep request bodies small.
+_Q_GET_COLLECTIVE: Final = textwrap.dedent("""
+    query GetCollective($slug: String!) {
+        collective(slug: $slug) {
+            id
+            slug
+            name
+            description
+            currency
+        }
+    }
+    """).strip()
+
+_Q_GET_EXPENSES: Final = textwrap.dedent("""
+    query GetExpenses(
+        $account: AccountReferenceInput!,
+        $limit: Int!,
+        $offset: Int!,
+        $status: [ExpenseStatusFilter],
+        $dateFrom: DateTime,
+        $fromAccount: AccountReferenceInput
+    ) {
+        expenses(
+            account: $account,
+            limit: $limit,
+            offset: $offset,
+            status: $status,
+            dateFrom: $dateFrom,
+            fromAccount: $fromAccount,
+            orderBy: { field: CREATED_AT, direction: DESC }
+        ) {
+            totalCount
+            nodes {
+                id
+                legacyId
+                description
+                amount
+                currency
+                type
+                status
+                createdAt
+                payee { name slug }
+                tags
+                items { id description amount url incurredAt }
+            }
+        }
+    }
+    """).strip()
+
+_Q_PROCESS_EXPENSE: Final = textwrap.dedent("""
+    mutation ProcessExpense(
+        $expense: ExpenseReferenceInput!,
+        $action: ExpenseProcessAction!,
+        $message: String
+    ) {
+        processExpense(expense: $expense, action: $action, message: $message) {
+            id
+            legacyId
+            description
+            status
+        }
+    }
+    """).strip()
+
+_Q_GET_PAYOUT_METHODS: Final = textwrap.dedent("""
+    query GetPayoutMethods($slug: String!) {
+        account(slug: $slug) {
+            id
+            slug
+            payoutMethods {
+                id
+                type
+                name
+                data
+                isSaved
+            }
+        }
+    }
+    """).strip()
+
+_Q_CREATE_EXPENSE: Final = textwrap.dedent("""
+    mutation CreateExpense(
+        $expense: ExpenseCreateInput!,
+        $account: AccountReferenceInput!
+    ) {
+        createExpense(expense: $expense, account: $account) {
+            id
+            legacyId
+            description
+            amount
+            status
+        }
+    }
+    """).strip()
+
+_Q_GET_ME: Final = textwrap.dedent("""
+    query {
+        me {
+            id
+            slug
+            name
+        }
+    }
+    """).strip()
+
+_Q_GET_ME_WITH_PAYOUT_METHODS: Final = textwrap.dedent("""
+    query {
+        me {
+            id
+            slug
+            name
+            payoutMethods {
+                id
+                type
+                name
+                data
+                isSaved
+            }
+        }
+    }
+    """).strip()
+
+_Q_DELETE_EXPENSE: Final = textwrap.dedent("""
+    mutation DeleteExpense($expense: ExpenseReferenceInput!) {
+        deleteExpense(expense: $expense) {
+            id
+            legacyId
+        }
+    }
+    """).strip()
+
+_Q_UPLOAD_FILE: Final = textwrap.dedent("""
+    mutation UploadFile($files: [UploadFileInput!]!) {
+        uploadFile(files: $files) {
+            file {
+                id
+                url
+                name
+                type
+                size
+            }
+        }
+    }
+    """).strip()
 
 
 def _check_graphql_errors(result: dict, prefix: str = "API") -> None:
@@ -39,6 +221,81 @@ def _check_graphql_errors(result: dict, prefix: str = "API") -> None:
         raise Exception(f"{prefix} error: {msg}")
 
 
+@functools.lru_cache(maxsize=32)
+def _get_many_collectives_query(count: int) -> str:
+    """Build the aliased query for get_many_collectives() with ``count`` slugs.
+
+    By default the API answers an unknown slug with a "not found" error for
+    the whole request, so each alias asks for null instead.
+    """
+    declarations = ", ".join(f"$s{i}: String!" for i in range(count))
+    fields = " ".join(
+        f"c{i}: collective(slug: $s{i}, throwIfMissing: false) "
+        "{ id slug name description currency }"
+        for i in range(count)
+    )
+    return f"query GetCollectives({declarations}) {{ {fields} }}"
+
+
+@functools.lru_cache(maxsize=32)
+def _process_expenses_mutation(count: int) -> str:
+    """Build the aliased mutation for process_expenses_bulk() on ``count`` IDs."""
+    declarations = [f"$e{i}: ExpenseReferenceInput!" for i in range(count)]
+    declarations += ["$action: ExpenseProcessAction!", "$message: String"]
+    fields = [
+        f"e{i}: processExpense("
+        f"expense: $e{i}, action: $action, message: $message"
+        ") { id legacyId description status }"
+        for i in range(count)
+    ]
+    return (
+        f"mutation ProcessExpenses({', '.join(declarations)}) "
+        f"{{ {' '.join(fields)} }}"
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _query_hash(query: str) -> str:
+    """Return the SHA-256 hex digest identifying a query for persisted queries."""
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+@functools.lru_cache(maxsize=128)
+def _query_prefix(query: str) -> bytes:
+    """Return the encoded ``{"query":...`` head of a request body."""
+    return b'{"query":' + _json.dumps(query)
+
+
+def _encode_request(query: str, variables: dict[str, Any] | None = None) -> bytes:
+    """Serialize a GraphQL request body to compact JSON.
+
+    The query text is most of the body and is fixed per operation, so its
+    encoding is cached and only the variables are serialized on each call.
+    Variables are omitted when empty.
+    """
+    if variables:
+        return _query_prefix(query) + b',"variables":' + _json.dumps(variables) + b"}"
+    return _query_prefix(query) + b"}"
+
+
+def _is_persisted_query_miss(result: dict) -> bool:
+    """Check whether the server did not recognize a persisted query hash."""
+    errors = result.get("errors") or []
+    return any(
+        (error.get("extensions") or {}).get("code") == "PERSISTED_QUERY_NOT_FOUND"
+        or error.get("message") == "PersistedQueryNotFound"
+        for error in errors
+    )
+
+
+def _is_auth_error(result: dict) -> bool:
+    """Check whether a GraphQL response rejected the request's credentials."""
+    return any(
+        (error.get("extensions") or {}).get("code") == "UNAUTHORIZED"
+        for error in result.get("errors") or []
+    )
+
+
 def _ensure_iso_datetime(date_str: str) -> str:
     """Convert a date-only string to full ISO datetime format.
 
@@ -84,35 +341,325 @@ def _open_file(file: str | BinaryIO, filename: str | None = None):
         yield file, resolved_name
 
 
+class _MultipartBody(io.RawIOBase):
+    """A multipart/form-data request body that streams its file part.
+
+    requests' ``files=`` support reads every file fully into memory to build
+    the body. This instead renders the small form fields and part headers
+    up front and reads the file lazily as the body is sent, so memory use
+    does not grow with file size. Defining ``__len__`` lets requests send a
+    Content-Length header rather than chunked transfer encoding.
+    """
+
+    def __init__(
+        self,
+        fields: dict[str, str],
+        file_field: str,
+        filename: str,
+        file_obj: BinaryIO,
+        mime_type: str,
+    ):
+        boundary = choose_boundary()
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+
+        head = []
+        for name, value in fields.items():
+            field = RequestField(name=name, data=value)
+            field.make_multipart(content_type="application/json")
+            head.append(f"--{boundary}\r\n{field.render_headers()}{value}\r\n")
+        file_part = RequestField(name=file_field, data=b"", filename=filename)
+        file_part.make_multipart(content_type=mime_type)
+        head.append(f"--{boundary}\r\n{file_part.render_headers()}")
+        head_bytes = "".join(head).encode()
+        tail_bytes = f"\r\n--{boundary}--\r\n".encode()
+
+        try:
+            start = file_obj.tell()
+            file_size = file_obj.seek(0, os.SEEK_END) - start
+            file_obj.seek(start)
+        except (AttributeError, OSError):
+            # Not seekable: fall back to buffering the remaining content
+            file_obj = io.BytesIO(file_obj.read())
+            file_size = len(file_obj.getbuffer())
+
+        self._parts: list[BinaryIO] = [
+            io.BytesIO(head_bytes),
+            file_obj,
+            io.BytesIO(tail_bytes),
+        ]
+        self._length = len(head_bytes) + file_size + len(tail_bytes)
+        self._position = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def readable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        # read() rather than readinto(): file-like objects need not have it
+        while self._parts:
+            chunk = self._parts[0].read(len(buffer))
+            if chunk:
+                n = len(chunk)
+                buffer[:n] = chunk
+                self._position += n
+                return n
+            self._parts.pop(0)
+        return 0
+
+
+# Keys every item passed to submit_multi_item_reimbursement() must have
+_REQUIRED_ITEM_KEYS = frozenset({"amount_cents", "description", "receipt_file"})
+
+
+def _expense_item(item: dict, url: str) -> dict:
+    """Convert a submit_multi_item_reimbursement() item to an ExpenseItemCreateInput.
+
+    Args:
+        item: Item dict with amount_cents, description and optional incurred_at.
+        url: URL of the item's uploaded receipt.
+
+    Returns:
+        Expense item input for the createExpense mutation.
+    """
+    expense_item = {
+        "description": item["description"],
+        "amount": item["amount_cents"],
+        "url": url,
+    }
+    if item.get("incurred_at"):
+        expense_item["incurredAt"] = _ensure_iso_datetime(item["incurred_at"])
+    return expense_item
+
+
+class _HTTPResponse(Protocol):
+    """The parts of a requests or httpx response the client reads."""
+
+    status_code: int
+    content: bytes
+
+    def raise_for_status(self) -> Any: ...
+
+
+def _httpx_post(client: "httpx.Client"):
+    """Adapt httpx.Client.post to the requests-style call used by the client.
+
+    Args:
+        client: httpx client to send requests with.
+
+    Returns:
+        A ``post(url, data=None, headers=None)`` callable. Bytes are sent as
+        is; file-like bodies are streamed in chunks with an explicit
+        Content-Length.
+    """
+
+    def post(url: str, data: Any = None, headers: dict | None = None):
+        if hasattr(data, "read"):
+            headers = {**(headers or {}), "Content-Length": str(len(data))}
+            data = iter(functools.partial(data.read, 65536), b"")
+        return client.post(url, content=data, headers=headers)
+
+    return post
+
+
+def _requests_session(headers: dict[str, str]) -> requests.Session:
+    """Build the requests session behind the default transport.
+
+    Args:
+        headers: Headers sent with every request.
+
+    Returns:
+        A session with pooled, retrying connections and the environment's
+        proxy and CA bundle settings resolved up front.
+    """
+    session = requests.Session()
+    # Keep persistent connections to the API host and the upload proxy and
+    # reuse them across calls. Status-based retries only apply to
+    # idempotent methods, so GraphQL mutations (POST) are never replayed
+    # after a 5xx.
+    adapter = HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)
+        ),
+    )
+    # Mounted for plain HTTP too, so a proxy or test server configured with
+    # an http:// URL gets the same pooling and retries.
+    for prefix in ("https://", "http://"):
+        session.mount(prefix, adapter)
+    # Resolve proxy and CA bundle settings from the environment once here
+    # rather than on every request. NO_PROXY may treat the two hosts
+    # differently, so each gets its own scheme://host entry; "" (rather
+    # than None, which requests drops when merging) means connect directly.
+    # A .netrc entry is never wanted: requests would let it replace the
+    # bearer token, so skipping the per-request lookup loses nothing.
+    for url in (API_URL, UPLOAD_API_URL):
+        env = session.merge_environment_settings(url, {}, None, None, None)
+        origin = url[: url.index("/", len("https://"))]
+        session.proxies[origin] = select_proxy(url, env["proxies"]) or ""
+    session.verify = env["verify"]
+    session.trust_env = False
+    session.headers.update(headers)
+    return session
+
+
+def _httpx_client(headers: dict[str, str]) -> "httpx.Client":
+    """Build the httpx client behind transport="httpx".
+
+    httpx is imported here rather than at module level so that the default
+    transport does not pay for it.
+
+    Args:
+        headers: Headers sent with every request.
+
+    Returns:
+        A client that negotiates HTTP/2 when the h2 package is installed.
+
+    Raises:
+        ImportError: If httpx is not installed.
+    """
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError(
+            "httpx is required for transport='httpx'. "
+            "Install with: pip install opencollective[http2]"
+        ) from None
+    return httpx.Client(
+        http2=importlib.util.find_spec("h2") is not None,
+        timeout=30,
+        headers=headers,
+    )
+
+
+def _read_cache_file(path: str) -> dict | None:
+    """Read a cache entry written within the last CACHE_TTL seconds.
+
+    Returns:
+        The entry, or None if it is missing, unreadable or expired.
+    """
+    try:
+        if time.time() - os.stat(path).st_mtime > CACHE_TTL:
+            return None
+        entry = _json.load_file(path)
+    except (OSError, ValueError):
+        return None
+    return entry if isinstance(entry, dict) and "etag" in entry else None
+
+
+def _prune_cache_dir(directory: str) -> None:
+    """Delete cache entries older than CACHE_TTL seconds."""
+    cutoff = time.time() - CACHE_TTL
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+    except OSError:
+        pass
+
+
+def _write_cache_file(path: str, entry: dict) -> None:
+    """Atomically write a cache entry readable only by the current user.
+
+    Expired entries in the same directory are removed at the same time.
+    Failures are ignored: the cache is an optimization, not a requirement.
+    """
+    directory = os.path.dirname(path)
+    _prune_cache_dir(directory)
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_json.dumps(entry))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
 class OpenCollectiveClient:
     """Client for interacting with the OpenCollective GraphQL API."""
 
-    def __init__(self, access_token: str | None = None):
+    __slots__ = (
+        "access_token",
+        "persisted_queries",
+        "_me_cache",
+        "_payout_cache",
+        "_session",
+        "_http",
+        "_post",
+    )
+
+    def __init__(
+        self,
+        access_token: str | None = None,
+        persisted_queries: bool = False,
+        transport: str = "requests",
+    ):
         """Initialize the client.
 
         Args:
             access_token: OAuth2 access token for authentication.
+            persisted_queries: Send a SHA-256 hash in place of the query text
+                (Apollo automatic persisted queries), falling back to the full
+                query when the server does not know the hash yet. Only enable
+                this against a server that supports the protocol.
+            transport: HTTP library to use: "requests" (default) or "httpx".
+                The httpx transport keeps one connection per host and
+                negotiates HTTP/2 when the h2 package is installed, so the
+                requests of a submission are multiplexed over a single
+                stream. HTTP errors are then raised as httpx.HTTPStatusError.
 
         Raises:
-            ValueError: If no access token is provided.
+            ValueError: If no access token is provided or the transport is
+                unknown.
+            ImportError: If transport="httpx" and httpx is not installed.
         """
         if not access_token:
             raise ValueError("access_token is required")
+        if transport not in ("requests", "httpx"):
+            raise ValueError(f"Unknown transport: {transport!r}")
         self.access_token = access_token
-        self._session = requests.Session()
-        self._session.headers.update(
-            {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {access_token}",
-            }
-        )
-
-    def _request(self, query: str, variables: dict[str, Any] = None) -> dict:
+        self.persisted_queries = persisted_queries
+        # The authenticated identity cannot change for a given token, so
+        # get_me() only needs to hit the API once per client.
+        self._me_cache: dict | None = None
+        # Payout methods change rarely; keyed by account slug, each entry is
+        # (monotonic expiry time, methods).
+        self._payout_cache: dict[str, tuple[float, list[dict]]] = {}
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {access_token}",
+            "User-Agent": f"opencollective-py/{__version__}",
+        }
+        # Exactly one of these is set, depending on the transport
+        self._session: requests.Session | None = None
+        self._http: httpx.Client | None = None
+        if transport == "httpx":
+            self._http = _httpx_client(headers)
+            self._post = _httpx_post(self._http)
+        else:
+            session = _requests_session(headers)
+            self._session = session
+            # Bound once so each request skips the attribute lookup
+            self._post = session.post
+
+    def _request(self, query: str, variables: dict[str, Any] | None = None) -> dict:
         """Make a GraphQL request.
 
         Args:
             query: GraphQL query or mutation.
-            variables: Variables for the query.
+            variables: Variables for the query. Omitted from the request body
+                when empty, which the server treats the same as no variables.
 
         Returns:
             The data from the response.
@@ -120,15 +667,103 @@ class OpenCollectiveClient:
         Raises:
             Exception: If the API returns an error.
         """
-        response = self._session.post(
-            API_URL,
-            json={"query": query, "variables": variables or {}},
-        )
+        result = self._execute(query, variables)
+        _check_graphql_errors(result, "API")
+        return result.get("data", {})
+
+    def _execute(self, query: str, variables: dict[str, Any] | None = None) -> dict:
+        """Send a GraphQL request and return the decoded response as is.
+
+        Unlike _request(), GraphQL errors are left in the result for the
+        caller to inspect alongside any partial data.
+        """
+        if self.persisted_queries:
+            body: dict[str, Any] = {
+                "extensions": {
+                    "persistedQuery": {"version": 1, "sha256Hash": _query_hash(query)}
+                }
+            }
+            if variables:
+                body["variables"] = variables
+            result = self._post_graphql(_json.dumps(body))
+            if not _is_persisted_query_miss(result):
+                return result
+            # Register the query under its hash for subsequent calls
+            body["query"] = query
+            payload = _json.dumps(body)
+        else:
+            payload = _encode_request(query, variables)
+
+        return self._post_graphql(payload)
+
+    def _post_graphql(self, payload: bytes) -> dict:
+        """POST an encoded GraphQL request body and decode the JSON response."""
+        # The session already sends Content-Type: application/json
+        response = self._post(API_URL, data=payload)
+        return self._decode_response(response)
+
+    def _decode_response(self, response: _HTTPResponse) -> dict:
+        """Raise for HTTP errors and decode the JSON body of a response.
+
+        Cached identity data is dropped if the server rejects the token.
+        """
+        if response.status_code == 401:
+            self.clear_cache()
         response.raise_for_status()
+        result = _json.loads(response.content)
+        if _is_auth_error(result):
+            self.clear_cache()
+        return result
+
+    def clear_cache(self) -> None:
+        """Forget the cached get_me() and get_payout_methods() results."""
+        self._me_cache = None
+        self._payout_cache.clear()
+
+    def _request_cached(
+        self, query: str, variables: dict[str, Any] | None = None
+    ) -> dict:
+        """Make a read-only GraphQL request, revalidating a local cache.
+
+        Responses that carry an ETag are stored under CACHE_DIR, keyed by a
+        hash of the access token, query and variables, in files only the
+        current user can read. Later calls send If-None-Match and reuse the
+        stored data when the server answers 304 Not Modified. Entries expire
+        after CACHE_TTL seconds. Only use this for data that is safe to keep
+        on disk.
+
+        Args:
+            query: GraphQL query.
+            variables: Variables for the query.
 
-        result = response.json()
+        Returns:
+            The data from the response.
+
+        Raises:
+            Exception: If the API returns an error.
+        """
+        payload = _encode_request(query, variables)
+
+        key = hashlib.blake2b(digest_size=16)
+        key.update(self.access_token.encode())
+        key.update(b"\0")
+        key.update(payload)
+        cache_path = os.path.join(CACHE_DIR, f"{key.hexdigest()}.json")
+        cached = _read_cache_file(cache_path)
+        headers = {"If-None-Match": cached["etag"]} if cached else None
+
+        response = self._post(API_URL, data=payload, headers=headers)
+        if response.status_code == 304 and cached:
+            return cached.get("data", {})
+
+        result = self._decode_response(response)
         _check_graphql_errors(result, "API")
-        return result.get("data", {})
+        data = result.get("data", {})
+
+        etag = response.headers.get("ETag")
+        if etag:
+            _write_cache_file(cache_path, {"etag": etag, "data": data})
+        return data
 
     def upload_file(
         self,
@@ -162,36 +797,29 @@ class OpenCollectiveClient:
 
             # GraphQL multipart request spec:
             # https://github.com/jaydenseric/graphql-multipart-request-spec
-            mutation = """
-            mutation UploadFile($files: [UploadFileInput!]!) {
-                uploadFile(files: $files) {
-                    file {
-                        id
-                        url
-                        name
-                        type
-                        size
-                    }
-                }
-            }
-            """
-
             operations = json.dumps(
                 {
-                    "query": mutation,
+                    "query": _Q_UPLOAD_FILE,
                     "variables": {"files": [{"kind": kind, "file": None}]},
                 }
             )
             file_map = json.dumps({"0": ["variables.files.0.file"]})
 
-            files = {
-                "operations": (None, operations, "application/json"),
-                "map": (None, file_map, "application/json"),
-                "0": (resolved_name, file_obj, mime_type),
-            }
+            body = _MultipartBody(
+                {"operations": operations, "map": file_map},
+                "0",
+                resolved_name,
+                file_obj,
+                mime_type,
+            )
 
-            headers = {"Authorization": f"Bearer {self.access_token}"}
-            response = requests.post(UPLOAD_API_URL, files=files, headers=headers)
+            # Authorization comes from the session; only the content type
+            # differs from regular API requests.
+            response = self._post(
+                UPLOAD_API_URL,
+                data=body,
+                headers={"Content-Type": body.content_type},
+            )
             response.raise_for_status()
 
             result = response.json()
@@ -217,20 +845,26 @@ class OpenCollectiveClient:
         Returns:
             Collective information including id, slug, name, description, currency.
         """
-        query = """
-        query GetCollective($slug: String!) {
-            collective(slug: $slug) {
-                id
-                slug
-                name
-                description
-                currency
-            }
-        }
-        """
-        data = self._request(query, {"slug": slug})
+        data = self._request_cached(_Q_GET_COLLECTIVE, {"slug": slug})
         return data.get("collective", {})
 
+    def get_many_collectives(self, slugs: list[str]) -> dict[str, dict]:
+        """Get information about several collectives in one request.
+
+        Args:
+            slugs: The collectives' slugs.
+
+        Returns:
+            Dict mapping each slug to its collective information (empty dict
+            if the collective was not found).
+        """
+        if not slugs:
+            return {}
+
+        query = _get_many_collectives_query(len(slugs))
+        data = self._request(query, {f"s{i}": slug for i, slug in enumerate(slugs)})
+        return {slug: data.get(f"c{i}") or {} for i, slug in enumerate(slugs)}
+
     def get_expenses(
         self,
         collective_slug: str,
@@ -238,7 +872,8 @@ class OpenCollectiveClient:
         offset: int = 0,
         status: str | None = None,
         date_from: str | None = None,
-    ) -> dict:
+        payee_slug: str | None = None,
+    ) -> ExpensesPage:
         """Get expenses for a collective.
 
         Args:
@@ -247,43 +882,12 @@ class OpenCollectiveClient:
             offset: Offset for pagination.
             status: Filter by status (PENDING, APPROVED, PAID, etc.).
             date_from: Filter expenses from this date (ISO format).
+            payee_slug: Only return expenses submitted by this payee. The
+                filter is applied server-side.
 
         Returns:
             Dict with totalCount and nodes (list of expenses).
         """
-        query = """
-        query GetExpenses(
-            $account: AccountReferenceInput!,
-            $limit: Int!,
-            $offset: Int!,
-            $status: [ExpenseStatusFilter],
-            $dateFrom: DateTime
-        ) {
-            expenses(
-                account: $account,
-                limit: $limit,
-                offset: $offset,
-                status: $status,
-                dateFrom: $dateFrom,
-                orderBy: { field: CREATED_AT, direction: DESC }
-            ) {
-                totalCount
-                nodes {
-                    id
-                    legacyId
-                    description
-                    amount
-                    currency
-                    type
-                    status
-                    createdAt
-                    payee { name slug }
-                    tags
-                    items { id description amount url incurredAt }
-                }
-            }
-        }
-        """
         variables = {
             "account": {"slug": collective_slug},
             "limit": limit,
@@ -293,9 +897,51 @@ class OpenCollectiveClient:
             variables["status"] = [status]
         if date_from:
             variables["dateFrom"] = date_from
+        if payee_slug:
+            variables["fromAccount"] = {"slug": payee_slug}
+
+        data = self._request(_Q_GET_EXPENSES, variables)
+        return cast(ExpensesPage, data.get("expenses", {"totalCount": 0, "nodes": []}))
+
+    def iter_expenses(
+        self,
+        collective_slug: str,
+        page_size: int = 100,
+        status: str | None = None,
+        date_from: str | None = None,
+        payee_slug: str | None = None,
+    ) -> Iterator[Expense]:
+        """Iterate over all matching expenses, fetching one page at a time.
+
+        Pages are requested lazily, so callers can start processing the
+        first expenses before later pages are fetched, and can stop early
+        without fetching the rest.
+
+        Args:
+            collective_slug: The collective's slug.
+            page_size: Number of expenses to request per page.
+            status: Filter by status (PENDING, APPROVED, PAID, etc.).
+            date_from: Filter expenses from this date (ISO format).
+            payee_slug: Only return expenses submitted by this payee.
 
-        data = self._request(query, variables)
-        return data.get("expenses", {"totalCount": 0, "nodes": []})
+        Yields:
+            Expense dicts, in the same order as get_expenses().
+        """
+        offset = 0
+        while True:
+            result = self.get_expenses(
+                collective_slug,
+                limit=page_size,
+                offset=offset,
+                status=status,
+                date_from=date_from,
+                payee_slug=payee_slug,
+            )
+            nodes = result.get("nodes") or []
+            yield from nodes
+            if len(nodes) < page_size or not nodes:
+                return
+            offset += page_size
 
     def approve_expense(self, expense_id: str) -> dict:
         """Approve a pending expense.
@@ -333,20 +979,6 @@ class OpenCollectiveClient:
         Returns:
             Updated expense data.
         """
-        mutation = """
-        mutation ProcessExpense(
-            $expense: ExpenseReferenceInput!,
-            $action: ExpenseProcessAction!,
-            $message: String
-        ) {
-            processExpense(expense: $expense, action: $action, message: $message) {
-                id
-                legacyId
-                description
-                status
-            }
-        }
-        """
         variables = {
             "expense": {"id": expense_id},
             "action": action,
@@ -354,36 +986,85 @@ class OpenCollectiveClient:
         if message:
             variables["message"] = message
 
-        data = self._request(mutation, variables)
+        data = self._request(_Q_PROCESS_EXPENSE, variables)
         return data.get("processExpense", {})
 
+    def process_expenses_bulk(
+        self, expense_ids: list[str], action: str, message: str | None = None
+    ) -> list[dict]:
+        """Apply the same action to several expenses in one request.
+
+        Each expense becomes an aliased processExpense field of a single
+        mutation document, so N approvals cost one round trip instead of N.
+
+        Args:
+            expense_ids: The expense IDs (not legacy IDs).
+            action: Action to take (APPROVE, REJECT, etc.).
+            message: Optional message for the action.
+
+        Returns:
+            Updated expense data, in the same order as expense_ids. An expense
+            the server refused to process is returned as ``{"id": ...,
+            "error": ...}`` with the error message, so the others' results
+            are kept.
+
+        Raises:
+            Exception: If the API returns an error not tied to one expense.
+        """
+        if not expense_ids:
+            return []
+
+        mutation = _process_expenses_mutation(len(expense_ids))
+        variables: dict[str, Any] = {
+            f"e{i}": {"id": expense_id} for i, expense_id in enumerate(expense_ids)
+        }
+        variables["action"] = action
+        if message:
+            variables["message"] = message
+
+        result = self._execute(mutation, variables)
+        data = result.get("data") or {}
+        results = [data.get(f"e{i}") or {} for i in range(len(expense_ids))]
+
+        # Each error's path starts at the alias of the expense it belongs to
+        aliases = {f"e{i}": i for i in range(len(expense_ids))}
+        for error in result.get("errors") or []:
+            path = error.get("path") or [None]
+            msg = error.get("message", "Unknown error")
+            index = aliases.get(path[0])
+            if index is None:
+                raise Exception(f"API error: {msg}")
+            if "error" not in results[index]:
+                results[index] = {"id": expense_ids[index], "error": msg}
+        return results
+
     def get_payout_methods(self, account_slug: str) -> list[dict]:
         """Get payout methods for an account.
 
         Args:
             account_slug: The account's slug (e.g., your user slug).
 
+        Results are cached on the client for PAYOUT_METHODS_TTL seconds. They
+        include bank and PayPal details, so they are never written to the
+        on-disk response cache.
+
         Returns:
             List of payout method objects with id, type, name, data.
         """
-        query = """
-        query GetPayoutMethods($slug: String!) {
-            account(slug: $slug) {
-                id
-                slug
-                payoutMethods {
-                    id
-                    type
-                    name
-                    data
-                    isSaved
-                }
-            }
-        }
-        """
-        data = self._request(query, {"slug": account_slug})
+        cached = self._payout_cache.get(account_slug)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        data = self._request(_Q_GET_PAYOUT_METHODS, {"slug": account_slug})
         account = data.get("account", {})
-        return account.get("payoutMethods", [])
+        methods = account.get("payoutMethods", [])
+        self._cache_payout_methods(account_slug, methods)
+        return methods
+
+    def _cache_payout_methods(self, account_slug: str, methods: list[dict]) -> None:
+        """Remember an account's payout methods for PAYOUT_METHODS_TTL seconds."""
+        expires = time.monotonic() + PAYOUT_METHODS_TTL
+        self._payout_cache[account_slug] = (expires, methods)
 
     def create_expense(
         self,
@@ -423,20 +1104,6 @@ class OpenCollectiveClient:
         Returns:
             Created expense data.
         """
-        mutation = """
-        mutation CreateExpense(
-            $expense: ExpenseCreateInput!,
-            $account: AccountReferenceInput!
-        ) {
-            createExpense(expense: $expense, account: $account) {
-                id
-                legacyId
-                description
-                amount
-                status
-            }
-        }
-        """
         item = {
             "description": description,
             "amount": amount_cents,
@@ -468,24 +1135,26 @@ class OpenCollectiveClient:
             "expense": expense_input,
         }
 
-        data = self._request(mutation, variables)
+        data = self._request(_Q_CREATE_EXPENSE, variables)
         return data.get("createExpense", {})
 
-    def get_pending_expenses(self, collective_slug: str) -> list[dict]:
+    def get_pending_expenses(self, collective_slug: str) -> list[Expense]:
         """Get all pending expenses for a collective.
 
+        Every page is fetched before returning, with no upper bound; use
+        iter_expenses() to stop early.
+
         Args:
             collective_slug: The collective's slug.
 
         Returns:
             List of pending expenses.
         """
-        result = self.get_expenses(collective_slug, status="PENDING", limit=100)
-        return result.get("nodes", [])
+        return list(self.iter_expenses(collective_slug, status="PENDING"))
 
     def get_my_expenses(
         self, collective_slug: str, payee_slug: str, limit: int = 50
-    ) -> list[dict]:
+    ) -> list[Expense]:
         """Get expenses submitted by a specific payee.
 
         Args:
@@ -496,30 +1165,46 @@ class OpenCollectiveClient:
         Returns:
             List of expenses from the payee.
         """
-        result = self.get_expenses(collective_slug, limit=limit)
-        return [
-            e
-            for e in result.get("nodes", [])
-            if e.get("payee", {}).get("slug") == payee_slug
-        ]
+        expenses = self.iter_expenses(
+            collective_slug, page_size=limit, payee_slug=payee_slug
+        )
+        return list(islice(expenses, limit))
 
     def get_me(self) -> dict:
         """Get the current authenticated user's account info.
 
+        The result is cached on the client after the first successful call.
+
         Returns:
             Dict with id, slug, name of the current user.
         """
-        query = """
-        query {
-            me {
-                id
-                slug
-                name
-            }
-        }
+        if self._me_cache:
+            return self._me_cache
+
+        data = self._request(_Q_GET_ME)
+        me = data.get("me") or {}
+        if me:
+            self._me_cache = me
+        return me
+
+    def get_me_with_payout_methods(self) -> tuple[dict, list[dict]]:
+        """Get the current user and their payout methods in one request.
+
+        Equivalent to get_me() followed by get_payout_methods() on the
+        user's slug, but costs a single round trip. Also fills the get_me()
+        and get_payout_methods() caches.
+
+        Returns:
+            Tuple of (user dict with id, slug, name; list of payout methods).
         """
-        data = self._request(query)
-        return data.get("me", {})
+        data = self._request(_Q_GET_ME_WITH_PAYOUT_METHODS)
+        me = data.get("me") or {}
+        methods = me.pop("payoutMethods", None) or []
+        if me:
+            self._me_cache = me
+            if me.get("slug"):
+                self._cache_payout_methods(me["slug"], methods)
+        return me, methods
 
     def delete_expense(self, expense_id: str) -> dict:
         """Delete an expense (only works for DRAFT or PENDING expenses you created).
@@ -530,15 +1215,7 @@ class OpenCollectiveClient:
         Returns:
             Dict with id and legacyId of deleted expense.
         """
-        mutation = """
-        mutation DeleteExpense($expense: ExpenseReferenceInput!) {
-            deleteExpense(expense: $expense) {
-                id
-                legacyId
-            }
-        }
-        """
-        data = self._request(mutation, {"expense": {"id": expense_id}})
+        data = self._request(_Q_DELETE_EXPENSE, {"expense": {"id": expense_id}})
         return data.get("deleteExpense", {})
 
     def _convert_html_to_pdf(self, html_path: str) -> str:
@@ -572,6 +1249,7 @@ class OpenCollectiveClient:
 
         Auto-detects the payee from the authenticated user if not provided,
         and selects the first available payout method if not specified.
+        When both need resolving, they are fetched in a single request.
 
         Args:
             payee_slug: Explicit payee slug, or None to auto-detect.
@@ -583,6 +1261,16 @@ class OpenCollectiveClient:
         Raises:
             ValueError: If payee cannot be determined.
         """
+        if not payee_slug and not payout_method_id and self._me_cache is None:
+            # Look up both in a single round trip
+            me, methods = self.get_me_with_payout_methods()
+            payee_slug = me.get("slug")
+            if not payee_slug:
+                raise ValueError(
+                    "Could not determine payee. Please provide payee_slug."
+                )
+            return payee_slug, methods[0]["id"] if methods else None
+
         if not payee_slug:
             me = self.get_me()
             payee_slug = me.get("slug")
@@ -700,7 +1388,7 @@ class OpenCollectiveClient:
         This is a high-level method that handles:
         - Auto-detecting payee from authenticated user if not provided
         - Auto-selecting first payout method if not provided
-        - Uploading each item's receipt file separately
+        - Uploading each item's receipt file, concurrently
         - Creating a single RECEIPT-type expense with multiple items
 
         Each item in the list should be a dict with:
@@ -723,6 +1411,10 @@ class OpenCollectiveClient:
         Returns:
             Created expense data with id, legacyId, description, status.
 
+        Raises:
+            ValueError: If an item is missing a required key, or a receipt
+                upload returns no URL.
+
         Example:
             >>> expense = client.submit_multi_item_reimbursement(
             ...     collective_slug="policyengine",
@@ -744,44 +1436,40 @@ class OpenCollectiveClient:
             ...     tags=["travel", "conference"],
             ... )
         """
+        # Fail on malformed items before any request is made
+        for index, item in enumerate(items):
+            missing = _REQUIRED_ITEM_KEYS - item.keys()
+            if missing:
+                raise ValueError(
+                    f"Item {index} is missing required keys: "
+                    f"{', '.join(sorted(missing))}"
+                )
+
         payee_slug, payout_method_id = self._resolve_payee_and_payout(
             payee_slug, payout_method_id
         )
 
-        # Upload each item's receipt and build the expense items list
-        expense_items = []
-        for item in items:
-            file_info = self.upload_file(item["receipt_file"], kind="EXPENSE_ITEM")
-            receipt_url = file_info.get("url")
-            if not receipt_url:
+        # Uploads are independent and I/O-bound, so run them in parallel.
+        # map() yields results in item order regardless of completion order.
+        def upload_receipt(item: dict) -> dict:
+            return self.upload_file(item["receipt_file"], kind="EXPENSE_ITEM")
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(MAX_UPLOAD_WORKERS, len(items)))
+        ) as executor:
+            uploads = list(executor.map(upload_receipt, items))
+
+        for item, file_info in zip(items, uploads):
+            if not file_info.get("url"):
                 raise ValueError(
                     f"Failed to upload receipt file for item: {item['description']}"
                 )
-
-            expense_item = {
-                "description": item["description"],
-                "amount": item["amount_cents"],
-                "url": receipt_url,
-            }
-            if item.get("incurred_at"):
-                expense_item["incurredAt"] = _ensure_iso_datetime(item["incurred_at"])
-            expense_items.append(expense_item)
+        expense_items = [
+            _expense_item(item, file_info["url"])
+            for item, file_info in zip(items, uploads)
+        ]
 
         # Build the expense mutation input
-        mutation = """
-        mutation CreateExpense(
-            $expense: ExpenseCreateInput!,
-            $account: AccountReferenceInput!
-        ) {
-            createExpense(expense: $expense, account: $account) {
-                id
-                legacyId
-                description
-                amount
-                status
-            }
-        }
-        """
         expense_input: dict[str, Any] = {
             "description": description,
             "type": "RECEIPT",
@@ -800,7 +1488,7 @@ class OpenCollectiveClient:
             "expense": expense_input,
         }
 
-        data = self._request(mutation, variables)
+        data = self._request(_Q_CREATE_EXPENSE, variables)
         return data.get("createExpense", {})
 
     def submit_invoice(
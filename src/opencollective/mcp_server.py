@@ -4,8 +4,9 @@ Run with: python -m opencollective.mcp_server
 Or add to Claude Code's MCP config.
 """
 
-import json
+import functools
 import os
+import textwrap
 from typing import Any
 
 try:
@@ -17,10 +18,29 @@ try:
 except ImportError:
     HAS_MCP = False
 
+from . import _json
 from .client import OpenCollectiveClient
 
 TOKEN_FILE = os.path.expanduser("~/.config/opencollective/token.json")
 
+_Q_GET_EXPENSE_ITEMS = textwrap.dedent("""
+    query GetExpense($expense: ExpenseReferenceInput!) {
+        expense(expense: $expense) {
+            id
+            legacyId
+            description
+            status
+            items {
+                id
+                description
+                amount
+                incurredAt
+                url
+            }
+        }
+    }
+    """).strip()
+
 
 def get_client() -> OpenCollectiveClient:
     """Get an authenticated client from saved token."""
@@ -29,8 +49,7 @@ def get_client() -> OpenCollectiveClient:
             f"No token found at {TOKEN_FILE}. Run 'oc auth' to authenticate."
         )
 
-    with open(TOKEN_FILE) as f:
-        token_data = json.load(f)
+    token_data = _json.load_file(TOKEN_FILE)
 
     return OpenCollectiveClient(access_token=token_data["access_token"])
 
@@ -45,8 +64,15 @@ def _text(content: str) -> list:
     return [TextContent(type="text", text=content)]
 
 
+@functools.lru_cache(maxsize=1)
 def create_server() -> "Server":
-    """Create and configure the MCP server."""
+    """Create and configure the MCP server.
+
+    The server holds no per-call state (tools build their client from
+    TOKEN_FILE when called), so it is built once and the same instance is
+    returned on later calls. Use ``create_server.cache_clear()`` to force a
+    rebuild.
+    """
     if not HAS_MCP:
         raise ImportError("MCP not installed. Run: pip install opencollective[mcp]")
 
@@ -354,12 +380,12 @@ def create_server() -> "Server":
                 )
 
             elif name == "list_expenses":
-                result = client.get_expenses(
+                page = client.get_expenses(
                     arguments["collective"],
                     status=arguments.get("status"),
                     limit=arguments.get("limit", 20),
                 )
-                nodes = result.get("nodes", [])
+                nodes = page.get("nodes", [])
 
                 if not nodes:
                     return _text("No expenses found.")
@@ -370,7 +396,7 @@ def create_server() -> "Server":
                     status = exp.get("status", "UNKNOWN")
                     desc = exp.get("description", "No description")
                     legacy_id = exp.get("legacyId", "?")
-                    payee = exp.get("payee", {}).get("name", "Unknown")
+                    payee = (exp.get("payee") or {}).get("name", "Unknown")
                     lines.append(
                         f"  #{legacy_id} ${amount:.2f} - {desc}\n"
                         f"     Payee: {payee} | Status: {status}"
@@ -400,8 +426,7 @@ def create_server() -> "Server":
                 )
 
             elif name == "get_me":
-                me = client.get_me()
-                methods = client.get_payout_methods(me["slug"])
+                me, methods = client.get_me_with_payout_methods()
                 text = f"Logged in as: {me.get('name')} (@{me.get('slug')})"
                 if methods:
                     text += "\n\nPayout methods:"
@@ -444,24 +469,9 @@ def create_server() -> "Server":
 
             elif name == "get_expense_items":
                 expense_id = arguments["expense_id"]
-                query = """
-                query GetExpense($expense: ExpenseReferenceInput!) {
-                    expense(expense: $expense) {
-                        id
-                        legacyId
-                        description
-                        status
-                        items {
-                            id
-                            description
-                            amount
-                            incurredAt
-                            url
-                        }
-                    }
-                }
-                """
-                data = client._request(query, {"expense": {"legacyId": expense_id}})
+                data = client._request(
+                    _Q_GET_EXPENSE_ITEMS, {"expense": {"legacyId": expense_id}}
+                )
                 expense = data.get("expense", {})
                 items = expense.get("items", [])
 
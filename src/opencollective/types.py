@@ -0,0 +1,48 @@
+"""Typed shapes of the GraphQL responses returned by the client.
+
+These are TypedDicts, so responses stay plain dicts at runtime and callers
+can keep using subscripts and ``.get()``. They only describe the fields the
+client's queries request; any field may be missing if the API omits it.
+"""
+
+from typing import TypedDict
+
+
+class Payee(TypedDict, total=False):
+    """Account that submitted an expense."""
+
+    name: str
+    slug: str
+
+
+class ExpenseItem(TypedDict, total=False):
+    """A single line item of an expense."""
+
+    id: str
+    description: str
+    amount: int
+    url: str | None
+    incurredAt: str
+
+
+class Expense(TypedDict, total=False):
+    """An expense as returned by get_expenses()."""
+
+    id: str
+    legacyId: int
+    description: str
+    amount: int
+    currency: str
+    type: str
+    status: str
+    createdAt: str
+    payee: Payee | None
+    tags: list[str]
+    items: list[ExpenseItem]
+
+
+class ExpensesPage(TypedDict):
+    """One page of expenses."""
+
+    totalCount: int
+    nodes: list[Expense]
@@ -0,0 +1,63 @@
+"""Micro-benchmarks for the client's hot paths.
+
+Skipped by default. Run with:
+
+    pytest tests/benchmarks --benchmark-enable --benchmark-only
+"""
+
+from ..conftest import API_URL
+
+_EXPENSE = {
+    "id": "exp1",
+    "legacyId": 123,
+    "description": "Cloud services",
+    "amount": 10000,
+    "currency": "USD",
+    "type": "RECEIPT",
+    "status": "PAID",
+    "createdAt": "2025-01-01T00:00:00Z",
+    "payee": {"name": "Max Ghenis", "slug": "max-ghenis"},
+    "tags": ["cloud"],
+    "items": [],
+}
+
+
+def test_get_expenses_bench(benchmark, client, mock_graphql):
+    """Build, send and decode a page of 50 expenses."""
+    mock_graphql.expenses([{**_EXPENSE, "legacyId": i} for i in range(50)])
+
+    result = benchmark(client.get_expenses, "policyengine", limit=50)
+
+    assert len(result["nodes"]) == 50
+
+
+def test_create_expense_bench(benchmark, client, mock_graphql):
+    """Build and send a createExpense mutation."""
+    mock_graphql.create_expense()
+
+    benchmark(
+        client.create_expense,
+        collective_slug="policyengine",
+        payee_slug="max-ghenis",
+        description="Cloud services",
+        amount_cents=10000,
+        payout_method_id="pm-123",
+        attachment_urls=["https://example.com/receipt.pdf"],
+        tags=["cloud"],
+    )
+
+
+def test_upload_file_bench(benchmark, client, mock_graphql, sample_pdf):
+    """Encode and send a multipart file upload."""
+    mock_graphql.upload()
+
+    result = benchmark(client.upload_file, sample_pdf)
+
+    assert result["url"] == "https://example.com/receipt.pdf"
+
+
+def test_request_bench(benchmark, client, rsps):
+    """Raw GraphQL round trip through _request."""
+    rsps.post(API_URL, json={"data": {"me": {"slug": "max-ghenis"}}})
+
+    benchmark(client._request, "query { me { slug } }")
@@ -1,8 +1,14 @@
 """Shared test fixtures and constants."""
 
+import asyncio
 import json
+import re
+from types import MappingProxyType
 
 import pytest
+import responses
+from responses.matchers import json_params_matcher
+from responses.registries import OrderedRegistry
 
 from opencollective import OpenCollectiveClient
 
@@ -11,13 +17,346 @@ API_URL = "https://api.opencollective.com/graphql/v2"
 # See: https://github.com/opencollective/opencollective-api/issues/11293
 UPLOAD_URL = "https://opencollective.com/api/graphql/v2"
 
+MISSING = object()
+"""Sentinel for assert_graphql_variables: the path must not be present."""
+
+
+def graphql_body(payload: dict) -> bytes:
+    """Encode a successful GraphQL response body with the given ``data``.
+
+    Payloads registered in many tests can be encoded once at import time and
+    passed as bytes to the mock helpers, which then skip re-serializing them.
+    """
+    return json.dumps({"data": payload}).encode()
+
+
+def body_json(call) -> dict:
+    """Decode the JSON body of a recorded ``responses`` call."""
+    return json.loads(call.request.body)
+
+
+def assert_graphql_variables(call, **expected) -> None:
+    """Assert on the variables of a recorded GraphQL request.
+
+    Keys are dotted paths into the variables, with integer segments
+    indexing lists, e.g. ``**{"expense.items.0.amount": 5000}``. Pass
+    ``MISSING`` as the value to assert that a path is absent.
+
+    Args:
+        call: A recorded ``responses`` call.
+        **expected: Mapping of variable path to expected value.
+    """
+    variables = body_json(call).get("variables", {})
+    for path, value in expected.items():
+        node = variables
+        for key in path.split("."):
+            if isinstance(node, list):
+                key = int(key)
+                found = key < len(node)
+            else:
+                found = key in node
+            if not found:
+                node = MISSING
+                break
+            node = node[key]
+        if value is MISSING:
+            assert node is MISSING, f"{path} = {node!r}, expected it to be absent"
+        else:
+            assert node is not MISSING, f"{path} is missing, expected {value!r}"
+            assert node == value, f"{path} = {node!r}, expected {value!r}"
+
+
+def graphql_query(call) -> str:
+    """Return the GraphQL document of a recorded request.
+
+    Decodes the JSON body once, so substring checks only scan the query
+    text rather than the whole serialized body.
+    """
+    return body_json(call)["query"]
+
+
+def selection_fields(query: str, field: str) -> set[str]:
+    """Return the field names selected under ``field`` in a GraphQL document.
+
+    Only handles flat selection sets such as ``items { id url }``.
+    """
+    match = re.search(rf"\b{field}\s*\{{([^{{}}]*)\}}", query)
+    assert match, f"no selection set for {field!r} in query"
+    return set(match.group(1).split())
+
+
+# Default field values for canned GraphQL responses. GraphQLMocker merges
+# per-test overrides on top of these; they are read-only so that no test can
+# change the defaults seen by another.
+_COLLECTIVE = MappingProxyType(
+    {
+        "id": "abc123",
+        "slug": "policyengine",
+        "name": "PolicyEngine",
+        "description": "Computing public policy",
+        "currency": "USD",
+    }
+)
+_ME = MappingProxyType({"id": "user-123", "slug": "max-ghenis"})
+_PAYOUT_METHOD = MappingProxyType({"id": "pm-123", "type": "BANK_ACCOUNT"})
+_EXPENSE = MappingProxyType({"id": "exp-123", "legacyId": 99999, "status": "PENDING"})
+_UPLOADED_FILE = MappingProxyType(
+    {"id": "file-123", "url": "https://example.com/receipt.pdf"}
+)
+_EXPENSE_NODE = MappingProxyType(
+    {
+        "id": "exp-123",
+        "legacyId": 99999,
+        "description": "",
+        "amount": 0,
+        "currency": "USD",
+        "status": "DRAFT",
+        "createdAt": "2025-01-01T00:00:00Z",
+        "payee": MappingProxyType({"name": "", "slug": ""}),
+    }
+)
+
+
+def make_expense(**overrides) -> dict:
+    """Build an expense node as returned by the ``expenses`` query.
+
+    Starts from a complete node with neutral defaults; pass only the
+    fields a test cares about.
+    """
+    return {**_EXPENSE_NODE, "payee": dict(_EXPENSE_NODE["payee"]), **overrides}
+
+
+# Default payee lookup and upload responses, encoded once for the many
+# submission tests that register them
+ME_BODY = graphql_body({"me": {**_ME, "payoutMethods": [dict(_PAYOUT_METHOD)]}})
+UPLOAD_BODY = graphql_body({"uploadFile": [{"file": dict(_UPLOADED_FILE)}]})
+
+
+class GraphQLMocker:
+    """Registers canned GraphQL responses with the ``responses`` library.
+
+    Each helper registers one response; responses for the same URL are
+    returned in registration order.
+    """
+
+    def __init__(self, rsps=responses):
+        self._rsps = rsps
+
+    def data(
+        self,
+        payload: dict | bytes,
+        url: str = API_URL,
+        variables: dict | None = None,
+        **kwargs,
+    ) -> responses.BaseResponse:
+        """Register a successful response with the given ``data`` payload.
+
+        ``payload`` may also be a body already encoded with graphql_body().
+        If ``variables`` is given, the response only matches requests whose
+        GraphQL variables contain it (extra keys are allowed); any other
+        request fails at call time with a ConnectionError.
+
+        Returns:
+            The registered response, whose ``calls`` record the requests it
+            served regardless of their position among all recorded calls.
+        """
+        if variables is not None:
+            kwargs["match"] = [
+                json_params_matcher({"variables": variables}, strict_match=False)
+            ]
+        if not isinstance(payload, bytes):
+            payload = graphql_body(payload)
+        return self._rsps.add(
+            responses.POST,
+            url,
+            body=payload,
+            content_type="application/json",
+            status=200,
+            **kwargs,
+        )
+
+    def errors(self, message: str, code: str | None = None, url: str = API_URL) -> None:
+        """Register a GraphQL error response."""
+        error = {"message": message}
+        if code:
+            error["extensions"] = {"code": code}
+        self._rsps.add(responses.POST, url, json={"errors": [error]}, status=200)
+
+    def not_modified(self, url: str = API_URL) -> None:
+        """Register an empty 304 Not Modified response."""
+        self._rsps.add(responses.POST, url, status=304)
+
+    def collective(self, **fields) -> None:
+        """Register a ``collective`` query response."""
+        self.data({"collective": {**_COLLECTIVE, **fields}})
+
+    def expenses(
+        self,
+        nodes: list[dict] | None = None,
+        total_count: int | None = None,
+        variables: dict | None = None,
+    ) -> None:
+        """Register an ``expenses`` query response."""
+        nodes = nodes or []
+        if total_count is None:
+            total_count = len(nodes)
+        self.data(
+            {"expenses": {"totalCount": total_count, "nodes": nodes}},
+            variables=variables,
+        )
+
+    def process_expense(self, **fields) -> None:
+        """Register a ``processExpense`` mutation response."""
+        self.data({"processExpense": {**_EXPENSE, **fields}})
+
+    def me(self, **fields) -> None:
+        """Register a ``me`` query response."""
+        self.data({"me": {**_ME, **fields}})
+
+    def payout_methods(self, methods: list[dict] | None = None, **fields) -> None:
+        """Register an ``account { payoutMethods }`` query response."""
+        if methods is None:
+            methods = [dict(_PAYOUT_METHOD)]
+        self.data({"account": {**fields, "payoutMethods": methods}})
+
+    def create_expense(
+        self, variables: dict | None = None, **fields
+    ) -> responses.BaseResponse:
+        """Register a ``createExpense`` mutation response."""
+        return self.data({"createExpense": {**_EXPENSE, **fields}}, variables=variables)
+
+    def delete_expense(self, **fields) -> None:
+        """Register a ``deleteExpense`` mutation response."""
+        self.data({"deleteExpense": {"id": _EXPENSE["id"], **fields}})
+
+    def upload(self, **fields) -> None:
+        """Register an ``uploadFile`` mutation response on the upload URL."""
+        if fields:
+            self.data(
+                {"uploadFile": [{"file": {**_UPLOADED_FILE, **fields}}]}, UPLOAD_URL
+            )
+        else:
+            self.data(UPLOAD_BODY, UPLOAD_URL)
+
+    def submit_flow(
+        self, uploads: int = 1, variables: dict | None = None, **fields
+    ) -> responses.BaseResponse:
+        """Register every response for a submit_* call that resolves the payee.
+
+        That is the combined ``me { payoutMethods }`` lookup, one
+        ``uploadFile`` per receipt and the final ``createExpense``, in
+        request order.
+
+        Args:
+            uploads: Number of files the call uploads.
+            variables: Expected createExpense variables, as for ``data``.
+            **fields: Overrides for the created expense.
+
+        Returns:
+            The registered createExpense response.
+        """
+        self.data(ME_BODY)
+        for i in range(uploads):
+            self.upload(id=f"file-{i}", url=f"https://example.com/receipt{i}.pdf")
+        return self.create_expense(variables=variables, **fields)
+
 
 @pytest.fixture
-def client():
-    """Create a client with a test token."""
+def rsps():
+    """Mock HTTP responses for the duration of one test."""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        yield mock
+
+
+@pytest.fixture
+def ordered_rsps():
+    """Mock HTTP responses that must be requested in registration order.
+
+    Each registered response is served once, and the test fails if any is
+    left unused.
+    """
+    with responses.RequestsMock(registry=OrderedRegistry) as mock:
+        yield mock
+
+
+def register_sequence(rsps, steps: list[tuple[str, dict | bytes]]) -> None:
+    """Register successful GraphQL responses for a sequence of calls.
+
+    Args:
+        rsps: The RequestsMock to register on, typically ``ordered_rsps``.
+        steps: ``(url, data)`` pairs, one per expected request, in order;
+            ``data`` may be pre-encoded with graphql_body().
+    """
+    mocker = GraphQLMocker(rsps)
+    for url, payload in steps:
+        mocker.data(payload, url)
+
+
+@pytest.fixture
+def mock_graphql(rsps):
+    """Helpers for registering canned GraphQL responses."""
+    return GraphQLMocker(rsps)
+
+
+@pytest.fixture
+def fake_gql(monkeypatch):
+    """Short-circuit the client's GraphQL layer with canned ``data`` payloads.
+
+    For tests that only check how the client post-processes a response;
+    no HTTP request is built or intercepted. Use ``mock_graphql`` when the
+    request body itself is under test.
+    """
+
+    def setter(payload: dict) -> None:
+        def fake_request(self, query, variables=None):
+            return payload
+
+        monkeypatch.setattr(OpenCollectiveClient, "_request", fake_request)
+        monkeypatch.setattr(OpenCollectiveClient, "_request_cached", fake_request)
+
+    return setter
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _session_cache_dir(tmp_path_factory):
+    """Keep the client's response cache out of the real home directory."""
+    cache_dir = tmp_path_factory.mktemp("cache")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("opencollective.client.CACHE_DIR", str(cache_dir))
+        yield cache_dir
+
+
+@pytest.fixture
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """An empty response cache directory of the test's own.
+
+    Only needed by tests that inspect the cache files; the rest share the
+    session directory.
+    """
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr("opencollective.client.CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+@pytest.fixture(scope="session")
+def shared_client():
+    """A client with a test token, built once per test session."""
     return OpenCollectiveClient(access_token="test_token")
 
 
+@pytest.fixture
+def client(shared_client):
+    """The module's shared client, with per-client caches cleared."""
+    shared_client.clear_cache()
+    return shared_client
+
+
+@pytest.fixture(scope="session")
+def bad_client():
+    """A client whose token the (mocked) API rejects."""
+    return OpenCollectiveClient(access_token="invalid_token")
+
+
 @pytest.fixture
 def mock_token(tmp_path):
     """Create a mock token file and return its path."""
@@ -26,3 +365,67 @@ def mock_token(tmp_path):
     token_file = token_dir / "token.json"
     token_file.write_text(json.dumps({"access_token": "test_token"}))
     return str(token_file)
+
+
+@pytest.fixture(scope="session")
+def upload_dir(tmp_path_factory):
+    """Directory of small sample files shared by the upload tests."""
+    return tmp_path_factory.mktemp("uploads")
+
+
+@pytest.fixture(scope="session")
+def sample_pdf(upload_dir):
+    """Path to a small fake PDF receipt."""
+    path = upload_dir / "fake.pdf"
+    path.write_bytes(b"test pdf content")
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def sample_invoice_pdf(upload_dir):
+    """Path to a small fake PDF invoice."""
+    path = upload_dir / "fake_invoice.pdf"
+    path.write_bytes(b"test invoice content")
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def sample_receipts(upload_dir):
+    """Paths to three distinct fake PDF receipts, for multi-item expenses."""
+    paths = []
+    for i in range(3):
+        path = upload_dir / f"receipt{i}.pdf"
+        path.write_bytes(f"receipt {i}".encode())
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture(scope="session")
+def mcp_server():
+    """The MCP server shared by the whole session (create_server() memoizes it)."""
+    pytest.importorskip("mcp")
+    from opencollective.mcp_server import create_server
+
+    return create_server()
+
+
+@pytest.fixture(scope="session")
+def mcp_loop():
+    """An event loop kept open for the session to drive MCP handlers.
+
+    Reusing one loop avoids creating and tearing down a loop for every
+    handler call, as asyncio.run() would.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def mcp_tools(mcp_server, mcp_loop):
+    """The MCP server's tools, keyed by name; listed once per session."""
+    from mcp.types import ListToolsRequest
+
+    handler = mcp_server.request_handlers[ListToolsRequest]
+    result = mcp_loop.run_until_complete(handler(ListToolsRequest(method="tools/list")))
+    return {tool.name: tool for tool in result.root.tools}
@@ -1,8 +1,5 @@
 """Tests for OAuth2 authentication."""
 
-import os
-import tempfile
-
 import pytest
 import responses
 
@@ -102,29 +99,24 @@ class TestOAuth2Handler:
 
         assert token_data["access_token"] == "new_access_token"
 
-    def test_save_and_load_token(self):
+    def test_save_and_load_token(self, tmp_path):
         """Handler can save and load tokens from file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            token_file = f.name
-
-        try:
-            handler = OAuth2Handler(
-                client_id="test_client_id",
-                client_secret="test_client_secret",
-                token_file=token_file,
-            )
-
-            token_data = {
-                "access_token": "saved_token",
-                "refresh_token": "saved_refresh",
-            }
-            handler.save_token(token_data)
-
-            loaded = handler.load_token()
-            assert loaded["access_token"] == "saved_token"
-            assert loaded["refresh_token"] == "saved_refresh"
-        finally:
-            os.unlink(token_file)
+        token_file = str(tmp_path / "token.json")
+        handler = OAuth2Handler(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            token_file=token_file,
+        )
+
+        token_data = {
+            "access_token": "saved_token",
+            "refresh_token": "saved_refresh",
+        }
+        handler.save_token(token_data)
+
+        loaded = handler.load_token()
+        assert loaded["access_token"] == "saved_token"
+        assert loaded["refresh_token"] == "saved_refresh"
 
     def test_load_token_missing_file(self):
         """Handler returns None for missing token file."""
@@ -1,20 +1,41 @@
 """Tests for OpenCollective CLI."""
 
+import subprocess
+import sys
+
 import pytest
 import responses
 from click.testing import CliRunner
 
-from opencollective.cli import cli
+from opencollective.cli import _format_cents, cli
 
-from .conftest import API_URL
+from .conftest import API_URL, body_json, make_expense
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def runner():
-    """Create a CLI test runner."""
+    """Create a CLI test runner shared by every test in this module."""
     return CliRunner()
 
 
+def test_cli_import_does_not_load_requests():
+    """Importing the CLI (e.g. for --help) does not import requests."""
+    code = "import sys, opencollective.cli; print('requests' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+@pytest.mark.parametrize(
+    "cents, expected",
+    [(0, "0.00"), (5, "0.05"), (1999, "19.99"), (32500, "325.00"), (-150, "-1.50")],
+)
+def test_format_cents(cents, expected):
+    """Cent amounts are formatted with integer arithmetic."""
+    assert _format_cents(cents) == expected
+
+
 class TestApproveCommand:
     """Tests for oc approve command."""
 
@@ -62,6 +83,13 @@ class TestApproveCommand:
         assert result.exit_code == 1
         assert "Error" in result.output
 
+    def test_approve_usage_error_is_not_swallowed(self, runner):
+        """Click usage errors keep their own message and exit code."""
+        result = runner.invoke(cli, ["approve"])
+
+        assert result.exit_code == 2
+        assert "Missing argument" in result.output
+
 
 class TestRejectCommand:
     """Tests for oc reject command."""
@@ -119,36 +147,134 @@ class TestRejectCommand:
         assert "Rejected expense #11111" in result.output
 
 
-class TestMeCommand:
-    """Tests for oc me command."""
+class TestExpensesCommand:
+    """Tests for oc expenses command."""
 
     @responses.activate
-    def test_me_command(self, runner, mock_token, monkeypatch):
-        """Can show current user info."""
+    def test_expenses_mine_filters_by_payee(self, runner, mock_token, monkeypatch):
+        """--mine asks the API for the current user's expenses only."""
         monkeypatch.setattr("opencollective.cli.TOKEN_FILE", mock_token)
 
         # Mock get_me
         responses.add(
+            responses.POST,
+            API_URL,
+            json={"data": {"me": {"id": "user-1", "slug": "test-user"}}},
+            status=200,
+        )
+        # Mock get_expenses
+        listing = responses.add(
             responses.POST,
             API_URL,
             json={
                 "data": {
-                    "me": {"id": "user-1", "slug": "test-user", "name": "Test User"}
+                    "expenses": {
+                        "totalCount": 1,
+                        "nodes": [
+                            make_expense(
+                                legacyId=42,
+                                description="Conference ticket",
+                                amount=32500,
+                                status="PENDING",
+                                payee={"name": "Test User", "slug": "test-user"},
+                            )
+                        ],
+                    }
                 }
             },
             status=200,
         )
-        # Mock get_payout_methods
+
+        result = runner.invoke(cli, ["expenses", "-c", "policyengine", "--mine"])
+
+        assert result.exit_code == 0
+        assert "#42 $325.00 - Conference ticket" in result.output
+        (listing_call,) = listing.calls
+        body = body_json(listing_call)
+        assert body["variables"]["fromAccount"] == {"slug": "test-user"}
+
+    @responses.activate
+    def test_expenses_mine_without_slug_fails(self, runner, mock_token, monkeypatch):
+        """--mine exits with an error instead of listing everyone's expenses."""
+        monkeypatch.setattr("opencollective.cli.TOKEN_FILE", mock_token)
+        responses.add(
+            responses.POST, API_URL, json={"data": {"me": {"id": "user-1"}}}, status=200
+        )
+
+        result = runner.invoke(cli, ["expenses", "-c", "policyengine", "--mine"])
+
+        assert result.exit_code == 1
+        assert "account slug" in result.output
+        responses.assert_call_count(API_URL, 1)
+
+    @responses.activate
+    def test_expenses_listing_layout(self, runner, mock_token, monkeypatch):
+        """Each expense renders as two lines followed by a blank line."""
+        monkeypatch.setattr("opencollective.cli.TOKEN_FILE", mock_token)
+
+        responses.add(
+            responses.POST,
+            API_URL,
+            json={
+                "data": {
+                    "expenses": {
+                        "totalCount": 2,
+                        "nodes": [
+                            make_expense(
+                                legacyId=1,
+                                description="Hosting",
+                                amount=1999,
+                                status="PAID",
+                                payee={"name": "Alex"},
+                            ),
+                            make_expense(
+                                legacyId=2,
+                                description="Travel",
+                                amount=50000,
+                                status="SPAM",
+                                payee=None,
+                            ),
+                        ],
+                    }
+                }
+            },
+            status=200,
+        )
+
+        result = runner.invoke(cli, ["expenses", "-c", "policyengine"])
+
+        assert result.exit_code == 0
+        assert result.output == (
+            "Found 2 expense(s):\n\n"
+            "  \U0001f4b0 #1 $19.99 - Hosting\n"
+            "     Payee: Alex | Status: PAID\n\n"
+            "  ? #2 $500.00 - Travel\n"
+            "     Payee: Unknown | Status: SPAM\n\n"
+        )
+
+
+class TestMeCommand:
+    """Tests for oc me command."""
+
+    @responses.activate
+    def test_me_command(self, runner, mock_token, monkeypatch):
+        """Can show current user info."""
+        monkeypatch.setattr("opencollective.cli.TOKEN_FILE", mock_token)
+
+        # Mock get_me_with_payout_methods
         responses.add(
             responses.POST,
             API_URL,
             json={
                 "data": {
-                    "account": {
+                    "me": {
+                        "id": "user-1",
+                        "slug": "test-user",
+                        "name": "Test User",
                         "payoutMethods": [
                             {"id": "pm-1", "type": "BANK_ACCOUNT"},
                             {"id": "pm-2", "type": "PAYPAL"},
-                        ]
+                        ],
                     }
                 }
             },
@@ -161,6 +287,7 @@ class TestMeCommand:
         assert "Test User" in result.output
         assert "@test-user" in result.output
         assert "BANK_ACCOUNT" in result.output
+        assert len(responses.calls) == 1
 
 
 class TestDeleteCommand:
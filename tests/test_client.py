@@ -1,15 +1,83 @@
 """Tests for OpenCollective client."""
 
-import os
-import tempfile
+import json
+import re
+import sys
 from io import BytesIO
 
 import pytest
-import responses
-
-from opencollective import OpenCollectiveClient
-
-from .conftest import API_URL, UPLOAD_URL
+import requests
+from requests.utils import select_proxy
+
+from opencollective import OpenCollectiveClient, _json
+
+from .conftest import (
+    API_URL,
+    ME_BODY,
+    MISSING,
+    UPLOAD_BODY,
+    UPLOAD_URL,
+    assert_graphql_variables,
+    body_json,
+    graphql_query,
+    make_expense,
+    register_sequence,
+    selection_fields,
+)
+
+PROXY = "http://proxy.example.com:3128"
+
+# Expense nodes shared by the get_expenses tests
+_EXPENSE_PAID = make_expense(
+    id="exp1",
+    legacyId=123,
+    description="Cloud services",
+    amount=10000,
+    status="PAID",
+    payee={"name": "Max Ghenis", "slug": "max-ghenis"},
+)
+_EXPENSE_PENDING = make_expense(
+    id="exp2",
+    legacyId=124,
+    description="Travel",
+    amount=50000,
+    status="PENDING",
+    createdAt="2025-01-02T00:00:00Z",
+    payee={"name": "Jane Doe", "slug": "jane-doe"},
+)
+_EXPENSE_WITH_ITEMS = make_expense(
+    id="exp1",
+    legacyId=100,
+    description="Cloud hosting",
+    amount=15000,
+    type="RECEIPT",
+    status="PAID",
+    createdAt="2026-01-15T00:00:00Z",
+    payee={"name": "Dev", "slug": "dev"},
+    tags=["hosting"],
+    items=[
+        {
+            "id": "item1",
+            "description": "January hosting",
+            "amount": 15000,
+            "url": "https://example.com/receipt.pdf",
+            "incurredAt": "2026-01-15T00:00:00Z",
+        }
+    ],
+)
+
+
+@pytest.fixture(scope="module")
+def shared_apq_client():
+    """A client with persisted queries enabled, built once for the module."""
+    return OpenCollectiveClient("test_token", persisted_queries=True)
+
+
+@pytest.fixture
+def apq_client(shared_apq_client):
+    """The module's persisted-query client, with its caches cleared."""
+    shared_apq_client.clear_cache()
+    return shared_apq_client
 
 
 class TestOpenCollectiveClient:
@@ -19,29 +87,86 @@ class TestOpenCollectiveClient:
         """Client can be initialized with an access token."""
         assert client.access_token == "test_token"
 
+    def test_client_resolves_environment_proxies_once(self, monkeypatch):
+        """Proxy settings from the environment are captured at init."""
+        monkeypatch.setenv("HTTPS_PROXY", PROXY)
+        monkeypatch.delenv("NO_PROXY", raising=False)
+        monkeypatch.delenv("no_proxy", raising=False)
+
+        client = OpenCollectiveClient(access_token="test_token")
+
+        session = client._session
+        for url in (API_URL, UPLOAD_URL):
+            proxies = session.merge_environment_settings(url, {}, None, None, None)
+            assert select_proxy(url, proxies["proxies"]) == PROXY
+        assert session.trust_env is False
+
+    def test_client_applies_no_proxy_per_host(self, monkeypatch):
+        """NO_PROXY is honored separately for the API and upload hosts."""
+        monkeypatch.setenv("HTTPS_PROXY", PROXY)
+        monkeypatch.setenv("NO_PROXY", "api.opencollective.com")
+        monkeypatch.delenv("no_proxy", raising=False)
+
+        session = OpenCollectiveClient(access_token="test_token")._session
+
+        api = session.merge_environment_settings(API_URL, {}, None, None, None)
+        upload = session.merge_environment_settings(UPLOAD_URL, {}, None, None, None)
+        assert not select_proxy(API_URL, api["proxies"])
+        assert select_proxy(UPLOAD_URL, upload["proxies"]) == PROXY
+
+    def test_client_retries_on_both_schemes(self, client):
+        """The pooled, retrying adapter serves http:// as well as https://."""
+        https = client._session.get_adapter("https://api.opencollective.com")
+        http = client._session.get_adapter("http://localhost")
+
+        assert http is https
+        assert https.max_retries.total == 3
+
+    def test_client_has_no_instance_dict(self, client):
+        """Client attributes live in slots rather than a per-instance dict."""
+        assert not hasattr(client, "__dict__")
+
     def test_client_init_without_token_raises(self):
         """Client raises error without token."""
         with pytest.raises(ValueError, match="access_token is required"):
             OpenCollectiveClient()
 
-    @responses.activate
-    def test_get_collective(self, client):
+    def test_persisted_query_sends_hash_only(self, rsps, apq_client, mock_graphql):
+        """With persisted queries on, a known hash is sent without the query."""
+        mock_graphql.me()
+
+        apq_client.get_me()
+
+        body = body_json(rsps.calls[0])
+        assert "query" not in body
+        assert body["extensions"]["persistedQuery"]["version"] == 1
+        assert len(body["extensions"]["persistedQuery"]["sha256Hash"]) == 64
+
+    def test_persisted_query_miss_retries_with_query(
+        self, rsps, apq_client, mock_graphql
+    ):
+        """An unknown hash is retried once with the full query text."""
+        mock_graphql.errors("PersistedQueryNotFound", code="PERSISTED_QUERY_NOT_FOUND")
+        mock_graphql.me()
+
+        me = apq_client.get_me()
+
+        assert me["slug"] == "max-ghenis"
+        first, second = (body_json(call) for call in rsps.calls)
+        assert "query" not in first
+        assert "me {" in second["query"]
+        assert second["extensions"] == first["extensions"]
+
+    def test_get_collective(self, client, fake_gql):
         """Can fetch collective information."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "collective": {
-                        "id": "abc123",
-                        "slug": "policyengine",
-                        "name": "PolicyEngine",
-                        "description": "Computing public policy",
-                        "currency": "USD",
-                    }
+        fake_gql(
+            {
+                "collective": {
+                    "slug": "policyengine",
+                    "name": "PolicyEngine",
+                    "currency": "USD",
                 }
-            },
-            status=200,
+            }
         )
 
         collective = client.get_collective("policyengine")
@@ -50,48 +175,10 @@ class TestOpenCollectiveClient:
         assert collective["name"] == "PolicyEngine"
         assert collective["currency"] == "USD"
 
-    @responses.activate
-    def test_get_expenses(self, client):
+    def test_get_expenses(self, client, fake_gql):
         """Can fetch expenses for a collective."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "expenses": {
-                        "totalCount": 2,
-                        "nodes": [
-                            {
-                                "id": "exp1",
-                                "legacyId": 123,
-                                "description": "Cloud services",
-                                "amount": 10000,
-                                "currency": "USD",
-                                "status": "PAID",
-                                "createdAt": "2025-01-01T00:00:00Z",
-                                "payee": {
-                                    "name": "Max Ghenis",
-                                    "slug": "max-ghenis",
-                                },
-                            },
-                            {
-                                "id": "exp2",
-                                "legacyId": 124,
-                                "description": "Travel",
-                                "amount": 50000,
-                                "currency": "USD",
-                                "status": "PENDING",
-                                "createdAt": "2025-01-02T00:00:00Z",
-                                "payee": {
-                                    "name": "Jane Doe",
-                                    "slug": "jane-doe",
-                                },
-                            },
-                        ],
-                    }
-                }
-            },
-            status=200,
+        fake_gql(
+            {"expenses": {"totalCount": 2, "nodes": [_EXPENSE_PAID, _EXPENSE_PENDING]}}
         )
 
         result = client.get_expenses("policyengine", limit=10)
@@ -101,106 +188,175 @@ class TestOpenCollectiveClient:
         assert result["nodes"][0]["description"] == "Cloud services"
         assert result["nodes"][0]["amount"] == 10000
 
-    @responses.activate
-    def test_get_expenses_with_status_filter(self, client):
+    def test_get_expenses_with_status_filter(self, client, fake_gql):
         """Can filter expenses by status."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "expenses": {
-                        "totalCount": 1,
-                        "nodes": [
-                            {
-                                "id": "exp2",
-                                "legacyId": 124,
-                                "description": "Travel",
-                                "amount": 50000,
-                                "currency": "USD",
-                                "status": "PENDING",
-                                "createdAt": "2025-01-02T00:00:00Z",
-                                "payee": {
-                                    "name": "Jane Doe",
-                                    "slug": "jane-doe",
-                                },
-                            },
-                        ],
-                    }
-                }
-            },
-            status=200,
-        )
+        fake_gql({"expenses": {"totalCount": 1, "nodes": [_EXPENSE_PENDING]}})
 
         result = client.get_expenses("policyengine", status="PENDING")
 
         assert result["totalCount"] == 1
         assert result["nodes"][0]["status"] == "PENDING"
 
-    @responses.activate
-    def test_approve_expense(self, client):
-        """Can approve a pending expense."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "processExpense": {
-                        "id": "exp2",
-                        "legacyId": 124,
-                        "description": "Travel",
-                        "status": "APPROVED",
-                    }
-                }
-            },
-            status=200,
+    def test_iter_expenses_paginates(self, rsps, client, mock_graphql):
+        """iter_expenses keeps requesting pages until a short page."""
+        mock_graphql.expenses([{"id": "exp1"}, {"id": "exp2"}], total_count=3)
+        mock_graphql.expenses([{"id": "exp3"}], total_count=3)
+
+        ids = [e["id"] for e in client.iter_expenses("policyengine", page_size=2)]
+
+        assert ids == ["exp1", "exp2", "exp3"]
+        offsets = [body_json(call)["variables"]["offset"] for call in rsps.calls]
+        assert offsets == [0, 2]
+
+    def test_get_pending_expenses_fetches_every_page(self, rsps, client, mock_graphql):
+        """get_pending_expenses keeps paging until the pending list is exhausted."""
+        first = [make_expense(id=f"exp{i}", status="PENDING") for i in range(100)]
+        mock_graphql.expenses(first, total_count=101, variables={"offset": 0})
+        mock_graphql.expenses(
+            [make_expense(id="exp100", status="PENDING")],
+            total_count=101,
+            variables={"offset": 100},
+        )
+
+        pending = client.get_pending_expenses("policyengine")
+
+        assert [e["id"] for e in pending] == [f"exp{i}" for i in range(101)]
+        assert len(rsps.calls) == 2
+        assert all(
+            body_json(call)["variables"]["status"] == ["PENDING"] for call in rsps.calls
         )
 
+    def test_get_my_expenses_filters_server_side(self, rsps, client, mock_graphql):
+        """get_my_expenses passes the payee to the API as fromAccount."""
+        mock_graphql.expenses()
+
+        client.get_my_expenses("policyengine", "max-ghenis")
+
+        body = body_json(rsps.calls[0])
+        assert body["variables"]["fromAccount"] == {"slug": "max-ghenis"}
+        assert "fromAccount: $fromAccount" in body["query"]
+
+    def test_approve_expense(self, client, fake_gql):
+        """Can approve a pending expense."""
+        fake_gql({"processExpense": {"id": "exp2", "status": "APPROVED"}})
+
         result = client.approve_expense("exp2")
 
         assert result["status"] == "APPROVED"
 
-    @responses.activate
-    def test_reject_expense(self, client):
+    def test_reject_expense(self, client, fake_gql):
         """Can reject a pending expense."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "processExpense": {
-                        "id": "exp2",
-                        "legacyId": 124,
-                        "description": "Travel",
-                        "status": "REJECTED",
-                    }
-                }
-            },
-            status=200,
-        )
+        fake_gql({"processExpense": {"id": "exp2", "status": "REJECTED"}})
 
         result = client.reject_expense("exp2", message="Invalid receipt")
 
         assert result["status"] == "REJECTED"
 
-    @responses.activate
-    def test_create_expense(self, client):
-        """Can create a new expense."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "createExpense": {
-                        "id": "exp3",
-                        "legacyId": 125,
-                        "description": "Software subscription",
-                        "amount": 2000,
-                        "status": "DRAFT",
-                    }
-                }
+    def test_process_expenses_bulk(self, rsps, client, mock_graphql):
+        """Approves several expenses with a single aliased mutation."""
+        mock_graphql.data(
+            {
+                "e0": {"id": "exp1", "legacyId": 123, "status": "APPROVED"},
+                "e1": {"id": "exp2", "legacyId": 124, "status": "APPROVED"},
+            }
+        )
+
+        results = client.process_expenses_bulk(["exp1", "exp2"], "APPROVE")
+
+        assert [r["legacyId"] for r in results] == [123, 124]
+        assert len(rsps.calls) == 1
+        body = body_json(rsps.calls[0])
+        assert "e1: processExpense(" in body["query"]
+        assert body["variables"]["e0"] == {"id": "exp1"}
+        assert body["variables"]["e1"] == {"id": "exp2"}
+        assert body["variables"]["action"] == "APPROVE"
+
+    def test_process_expenses_bulk_keeps_partial_results(self, client, mock_graphql):
+        """An expense the server refuses does not discard the others."""
+        body = {
+            "data": {
+                "e0": {"id": "exp1", "legacyId": 123, "status": "APPROVED"},
+                "e1": None,
             },
-            status=200,
+            "errors": [{"message": "Expense is already paid", "path": ["e1"]}],
+        }
+        mock_graphql.data(json.dumps(body).encode())
+
+        results = client.process_expenses_bulk(["exp1", "exp2"], "APPROVE")
+
+        assert results == [
+            {"id": "exp1", "legacyId": 123, "status": "APPROVED"},
+            {"id": "exp2", "error": "Expense is already paid"},
+        ]
+
+    def test_process_expenses_bulk_request_error_raises(self, client, mock_graphql):
+        """Errors not tied to one expense still fail the whole call."""
+        mock_graphql.errors("Unauthorized", code="UNAUTHORIZED")
+
+        with pytest.raises(Exception, match="API error: Unauthorized"):
+            client.process_expenses_bulk(["exp1", "exp2"], "APPROVE")
+
+    def test_process_expenses_bulk_empty(self, client):
+        """No request is made for an empty list of expenses."""
+        assert client.process_expenses_bulk([], "APPROVE") == []
+
+    def test_get_many_collectives(self, rsps, client, mock_graphql):
+        """Fetches several collectives with a single aliased query."""
+        # With throwIfMissing: false the API returns null, not an error
+        mock_graphql.data(
+            {"c0": {"slug": "policyengine", "name": "PolicyEngine"}, "c1": None}
+        )
+
+        result = client.get_many_collectives(["policyengine", "missing"])
+
+        assert result["policyengine"]["name"] == "PolicyEngine"
+        assert result["missing"] == {}
+        body = body_json(rsps.calls[0])
+        assert body["variables"] == {"s0": "policyengine", "s1": "missing"}
+        assert "c1: collective(slug: $s1, throwIfMissing: false)" in body["query"]
+
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            pytest.param({}, {"type": "RECEIPT"}, id="minimal"),
+            pytest.param(
+                {
+                    "attachment_urls": ["https://example.com/receipt.pdf"],
+                    "tags": ["cloud", "infrastructure"],
+                },
+                {
+                    "attachedFiles": [{"url": "https://example.com/receipt.pdf"}],
+                    "tags": ["cloud", "infrastructure"],
+                },
+                id="attachments",
+            ),
+            pytest.param(
+                {
+                    "expense_type": "INVOICE",
+                    "invoice_url": "https://example.com/invoice.pdf",
+                },
+                {
+                    "type": "INVOICE",
+                    "invoiceFile": {"url": "https://example.com/invoice.pdf"},
+                },
+                id="invoice",
+            ),
+            pytest.param(
+                {"payout_method_id": "pm_abc123"},
+                {"payoutMethod": {"id": "pm_abc123"}},
+                id="payout-method",
+            ),
+        ],
+    )
+    def test_create_expense(self, client, mock_graphql, kwargs, expected):
+        """Optional create_expense arguments are reflected in the mutation."""
+        mock_graphql.create_expense(
+            variables={"expense": expected},
+            id="exp3",
+            legacyId=125,
+            description="Software subscription",
+            amount=2000,
+            status="DRAFT",
         )
 
         result = client.create_expense(
@@ -208,113 +364,33 @@ class TestOpenCollectiveClient:
             payee_slug="max-ghenis",
             description="Software subscription",
             amount_cents=2000,
+            **kwargs,
         )
 
         assert result["description"] == "Software subscription"
         assert result["status"] == "DRAFT"
 
-    @responses.activate
-    def test_create_expense_with_attachments(self, client):
-        """Can create an expense with file attachments."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "createExpense": {
-                        "id": "exp4",
-                        "legacyId": 126,
-                        "description": "GCP Cloud Services",
-                        "amount": 15000,
-                        "status": "DRAFT",
-                    }
-                }
-            },
-            status=200,
-        )
-
-        result = client.create_expense(
-            collective_slug="policyengine",
-            payee_slug="max-ghenis",
-            description="GCP Cloud Services",
-            amount_cents=15000,
-            attachment_urls=["https://example.com/receipt.pdf"],
-            tags=["cloud", "infrastructure"],
-        )
-
-        assert result["description"] == "GCP Cloud Services"
-        assert result["status"] == "DRAFT"
-
-        request_body = responses.calls[0].request.body.decode()
-        assert "attachedFiles" in request_body
-        assert "https://example.com/receipt.pdf" in request_body
-
-    @responses.activate
-    def test_create_invoice_expense(self, client):
-        """Can create an invoice expense with invoice file."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "createExpense": {
-                        "id": "exp5",
-                        "legacyId": 127,
-                        "description": "Consulting services",
-                        "amount": 100000,
-                        "status": "DRAFT",
-                    }
-                }
-            },
-            status=200,
-        )
-
-        result = client.create_expense(
-            collective_slug="policyengine",
-            payee_slug="max-ghenis",
-            description="Consulting services",
-            amount_cents=100000,
-            expense_type="INVOICE",
-            invoice_url="https://example.com/invoice.pdf",
-        )
-
-        assert result["description"] == "Consulting services"
-
-        request_body = responses.calls[0].request.body.decode()
-        assert "invoiceFile" in request_body
-        assert "https://example.com/invoice.pdf" in request_body
-
-    @responses.activate
-    def test_get_payout_methods(self, client):
+    def test_get_payout_methods(self, client, mock_graphql):
         """Can fetch payout methods for an account."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "account": {
-                        "id": "user123",
-                        "slug": "max-ghenis",
-                        "payoutMethods": [
-                            {
-                                "id": "pm_abc123",
-                                "type": "BANK_ACCOUNT",
-                                "name": "Chase ****1234",
-                                "data": {"currency": "USD"},
-                                "isSaved": True,
-                            },
-                            {
-                                "id": "pm_def456",
-                                "type": "PAYPAL",
-                                "name": "PayPal",
-                                "data": {"email": "max@example.com"},
-                                "isSaved": True,
-                            },
-                        ],
-                    }
-                }
-            },
-            status=200,
+        mock_graphql.payout_methods(
+            [
+                {
+                    "id": "pm_abc123",
+                    "type": "BANK_ACCOUNT",
+                    "name": "Chase ****1234",
+                    "data": {"currency": "USD"},
+                    "isSaved": True,
+                },
+                {
+                    "id": "pm_def456",
+                    "type": "PAYPAL",
+                    "name": "PayPal",
+                    "data": {"email": "max@example.com"},
+                    "isSaved": True,
+                },
+            ],
+            id="user123",
+            slug="max-ghenis",
         )
 
         methods = client.get_payout_methods("max-ghenis")
@@ -324,139 +400,160 @@ class TestOpenCollectiveClient:
         assert methods[0]["type"] == "BANK_ACCOUNT"
         assert methods[1]["type"] == "PAYPAL"
 
-    @responses.activate
-    def test_create_expense_with_payout_method(self, client):
-        """Can create expense with payout method."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "createExpense": {
-                        "id": "exp6",
-                        "legacyId": 128,
-                        "description": "Cloud services",
-                        "amount": 10000,
-                        "status": "DRAFT",
-                    }
-                }
-            },
-            status=200,
-        )
+    def test_get_collective_without_orjson(self, client, mock_graphql, monkeypatch):
+        """Falls back to stdlib json when orjson is not installed."""
+        monkeypatch.setattr("opencollective._json.HAS_ORJSON", False)
+        mock_graphql.collective()
 
-        result = client.create_expense(
-            collective_slug="policyengine",
-            payee_slug="max-ghenis",
-            description="Cloud services",
-            amount_cents=10000,
-            payout_method_id="pm_abc123",
+        collective = client.get_collective("policyengine")
+
+        assert collective["slug"] == "policyengine"
+
+    def test_request_body_is_compact_json(self, rsps, client, mock_graphql):
+        """The cached query prefix yields the same body as encoding it whole."""
+        mock_graphql.process_expense()
+
+        client.approve_expense("exp-123")
+
+        body = rsps.calls[0].request.body
+        assert body == _json.dumps(body_json(rsps.calls[0]))
+        assert body_json(rsps.calls[0])["variables"]["expense"] == {"id": "exp-123"}
+
+    def test_get_collective_revalidates_with_etag(
+        self, rsps, client, mock_graphql, isolated_cache_dir
+    ):
+        """A cached collective is reused when the server answers 304."""
+        mock_graphql.data(
+            {"collective": {"slug": "policyengine"}}, headers={"ETag": '"v1"'}
+        )
+        mock_graphql.not_modified()
+
+        first = client.get_collective("policyengine")
+        second = client.get_collective("policyengine")
+
+        assert first == second == {"slug": "policyengine"}
+        assert "If-None-Match" not in rsps.calls[0].request.headers
+        assert rsps.calls[1].request.headers["If-None-Match"] == '"v1"'
+        (cache_file,) = isolated_cache_dir.iterdir()
+        assert cache_file.stat().st_mode & 0o777 == 0o600
+
+    def test_response_cache_is_per_token(
+        self, rsps, client, bad_client, mock_graphql, isolated_cache_dir
+    ):
+        """An entry cached for one token is not revalidated with another."""
+        mock_graphql.data({"collective": {"slug": "pe"}}, headers={"ETag": '"v1"'})
+        mock_graphql.data({"collective": {"slug": "pe"}}, headers={"ETag": '"v1"'})
+
+        client.get_collective("pe")
+        bad_client.get_collective("pe")
+
+        assert "If-None-Match" not in rsps.calls[1].request.headers
+        assert len(list(isolated_cache_dir.iterdir())) == 2
+
+    def test_expired_cache_entries_are_refetched_and_pruned(
+        self, rsps, client, mock_graphql, isolated_cache_dir, monkeypatch
+    ):
+        """Entries older than CACHE_TTL are neither revalidated nor kept."""
+        for slug in ("pe", "x", "pe"):
+            mock_graphql.data(
+                {"collective": {"slug": slug}}, headers={"ETag": f'"{slug}"'}
+            )
+        client.get_collective("pe")
+        client.get_collective("x")
+        monkeypatch.setattr("opencollective.client.CACHE_TTL", -1)
+
+        client.get_collective("pe")
+
+        assert "If-None-Match" not in rsps.calls[2].request.headers
+        (cache_file,) = isolated_cache_dir.iterdir()
+        assert json.loads(cache_file.read_bytes())["data"] == {
+            "collective": {"slug": "pe"}
+        }
+
+    def test_payout_methods_are_not_cached_on_disk(
+        self, client, mock_graphql, isolated_cache_dir
+    ):
+        """Payout method details never reach the on-disk response cache."""
+        mock_graphql.data(
+            {"account": {"payoutMethods": [{"id": "pm-1", "data": {"iban": "X"}}]}},
+            headers={"ETag": '"v1"'},
         )
 
-        assert result["description"] == "Cloud services"
-        assert result["status"] == "DRAFT"
+        client.get_payout_methods("max-ghenis")
 
-        request_body = responses.calls[0].request.body.decode()
-        assert "payoutMethod" in request_body
-        assert "pm_abc123" in request_body
+        assert not isolated_cache_dir.exists() or not any(isolated_cache_dir.iterdir())
 
-    @responses.activate
-    def test_api_error_handling(self):
+    def test_api_error_handling(self, bad_client, monkeypatch):
         """Client handles API errors gracefully."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(
+            {
                 "errors": [
-                    {
-                        "message": "Unauthorized",
-                        "extensions": {"code": "UNAUTHORIZED"},
-                    }
+                    {"message": "Unauthorized", "extensions": {"code": "UNAUTHORIZED"}}
                 ]
-            },
-            status=200,
-        )
-
-        client = OpenCollectiveClient(access_token="invalid_token")
+            }
+        ).encode()
+        monkeypatch.setattr(bad_client, "_post", lambda *args, **kwargs: response)
 
         with pytest.raises(Exception, match="API error"):
-            client.get_collective("policyengine")
+            bad_client.get_collective("policyengine")
 
-    @responses.activate
-    def test_http_error_handling(self, client):
+    def test_http_error_handling(self, client, monkeypatch):
         """Client handles HTTP errors."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            status=500,
-        )
 
-        with pytest.raises(Exception):
+        def boom(*args, **kwargs):
+            raise requests.HTTPError("500 Server Error")
+
+        monkeypatch.setattr(client, "_post", boom)
+
+        with pytest.raises(requests.HTTPError):
             client.get_collective("policyengine")
 
 
 class TestUploadFile:
     """Tests for file upload functionality."""
 
-    @responses.activate
-    def test_upload_file_from_path(self, client):
+    def test_upload_file_from_path(self, rsps, client, mock_graphql, sample_pdf):
         """Can upload a file from a file path."""
-        responses.add(
-            responses.POST,
-            UPLOAD_URL,
-            json={
-                "data": {
-                    "uploadFile": {
-                        "file": {
-                            "id": "file-abc123",
-                            "url": "https://opencollective-production.s3.us-west-1.amazonaws.com/abc123.pdf",
-                            "name": "test.pdf",
-                            "type": "application/pdf",
-                            "size": 16,
-                        }
-                    }
-                }
-            },
-            status=200,
+        mock_graphql.upload(
+            id="file-abc123",
+            url="https://opencollective-production.s3.us-west-1.amazonaws.com/abc123.pdf",
+            name="test.pdf",
+            type="application/pdf",
+            size=16,
         )
 
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            f.write(b"test pdf content")
-            temp_path = f.name
-
-        try:
-            result = client.upload_file(temp_path)
-            assert (
-                result["url"]
-                == "https://opencollective-production.s3.us-west-1.amazonaws.com/abc123.pdf"
-            )
-            assert result["id"] == "file-abc123"
+        result = client.upload_file(sample_pdf)
+        assert (
+            result["url"]
+            == "https://opencollective-production.s3.us-west-1.amazonaws.com/abc123.pdf"
+        )
+        assert result["id"] == "file-abc123"
 
-            request = responses.calls[0].request
-            assert b"operations" in request.body
-            assert b"EXPENSE_ATTACHED_FILE" in request.body
-        finally:
-            os.unlink(temp_path)
+        request = rsps.calls[0].request
+        assert b"operations" in request.body
+        assert b"EXPENSE_ATTACHED_FILE" in request.body
+        # Sent through the client's session, with its auth and user agent
+        assert request.headers["Authorization"] == "Bearer test_token"
+        assert request.headers["User-Agent"].startswith("opencollective-py/")
 
-    @responses.activate
-    def test_upload_file_from_file_object(self, client):
+    def test_upload_file_from_file_object(self, rsps, client, mock_graphql):
         """Can upload a file from a file-like object."""
-        responses.add(
-            responses.POST,
-            UPLOAD_URL,
-            json={
-                "data": {
-                    "uploadFile": {
-                        "file": {
-                            "id": "file-def456",
-                            "url": "https://opencollective-production.s3.us-west-1.amazonaws.com/def456.png",
-                            "name": "receipt.png",
-                            "type": "image/png",
-                            "size": 18,
-                        }
+        # Older API versions return a single object rather than a list
+        mock_graphql.data(
+            {
+                "uploadFile": {
+                    "file": {
+                        "id": "file-def456",
+                        "url": "https://opencollective-production.s3.us-west-1.amazonaws.com/def456.png",
+                        "name": "receipt.png",
+                        "type": "image/png",
+                        "size": 18,
                     }
                 }
             },
-            status=200,
+            UPLOAD_URL,
         )
 
         file_obj = BytesIO(b"test image content")
@@ -470,94 +567,78 @@ class TestUploadFile:
         )
         assert result["name"] == "receipt.png"
 
-        request = responses.calls[0].request
+        request = rsps.calls[0].request
         assert b"EXPENSE_ITEM" in request.body
 
-    @responses.activate
-    def test_upload_file_with_custom_kind(self, client):
-        """Can upload a file with custom file kind."""
-        responses.add(
-            responses.POST,
-            UPLOAD_URL,
-            json={
-                "data": {
-                    "uploadFile": {
-                        "file": {
-                            "id": "file-ghi789",
-                            "url": "https://opencollective-production.s3.us-west-1.amazonaws.com/ghi789.pdf",
-                            "name": "invoice.pdf",
-                            "type": "application/pdf",
-                            "size": 20,
-                        }
-                    }
-                }
-            },
-            status=200,
+    @pytest.mark.parametrize(
+        "kind, filename",
+        [
+            ("EXPENSE_ATTACHED_FILE", "test.pdf"),
+            ("EXPENSE_INVOICE", "invoice.pdf"),
+        ],
+    )
+    def test_upload_file_with_kind(self, rsps, client, mock_graphql, kind, filename):
+        """Can upload an in-memory file with a given file kind."""
+        mock_graphql.upload(
+            id="file-ghi789",
+            url="https://opencollective-production.s3.us-west-1.amazonaws.com/ghi789.pdf",
+            name=filename,
+            type="application/pdf",
+            size=20,
+        )
+
+        file_obj = BytesIO(b"test pdf content")
+        result = client.upload_file(file_obj, filename=filename, kind=kind)
+        assert (
+            result["url"]
+            == "https://opencollective-production.s3.us-west-1.amazonaws.com/ghi789.pdf"
         )
+        assert result["name"] == filename
 
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            f.write(b"test invoice content")
-            temp_path = f.name
+        request = rsps.calls[0].request
+        assert kind.encode() in request.body
+        assert filename.encode() in request.body
 
-        try:
-            result = client.upload_file(temp_path, kind="EXPENSE_INVOICE")
-            assert (
-                result["url"]
-                == "https://opencollective-production.s3.us-west-1.amazonaws.com/ghi789.pdf"
-            )
+    def test_upload_file_streams_body_with_content_length(
+        self, rsps, client, mock_graphql
+    ):
+        """The multipart body is sent with an exact length and intact content."""
+        mock_graphql.upload()
+        content = b"%PDF-1.4\r\n" + bytes(range(256)) * 512
+        file_obj = BytesIO(content)
+        file_obj.seek(9)  # Only the remainder of a partially read file is sent
 
-            request = responses.calls[0].request
-            assert b"EXPENSE_INVOICE" in request.body
-        finally:
-            os.unlink(temp_path)
+        client.upload_file(file_obj, filename="scan.pdf")
+
+        request = rsps.calls[0].request
+        assert int(request.headers["Content-Length"]) == len(request.body)
+        assert request.headers["Content-Type"].startswith("multipart/form-data")
+        assert b'filename="scan.pdf"' in request.body
+        assert content[9:] + b"\r\n--" in request.body
+        assert content[:9] not in request.body
 
     def test_upload_file_not_found(self, client):
         """Raises FileNotFoundError for nonexistent file."""
         with pytest.raises(FileNotFoundError, match="File not found"):
             client.upload_file("/nonexistent/path/to/file.pdf")
 
-    @responses.activate
-    def test_upload_file_api_error(self, client):
+    def test_upload_file_api_error(self, client, mock_graphql):
         """Handles API error responses."""
-        responses.add(
-            responses.POST,
-            UPLOAD_URL,
-            json={
-                "errors": [
-                    {
-                        "message": "Invalid file type",
-                        "extensions": {"code": "BAD_REQUEST"},
-                    }
-                ]
-            },
-            status=200,
-        )
+        mock_graphql.errors("Invalid file type", code="BAD_REQUEST", url=UPLOAD_URL)
 
         file_obj = BytesIO(b"test content")
 
         with pytest.raises(Exception, match="Invalid file type"):
             client.upload_file(file_obj, filename="test.txt")
 
-    @responses.activate
-    def test_upload_file_mime_type_detection(self, client):
+    def test_upload_file_mime_type_detection(self, rsps, client, mock_graphql):
         """Correctly detects MIME type from filename."""
-        responses.add(
-            responses.POST,
-            UPLOAD_URL,
-            json={
-                "data": {
-                    "uploadFile": {
-                        "file": {
-                            "id": "file-mime123",
-                            "url": "https://opencollective-production.s3.us-west-1.amazonaws.com/mime123.png",
-                            "name": "image.png",
-                            "type": "image/png",
-                            "size": 16,
-                        }
-                    }
-                }
-            },
-            status=200,
+        mock_graphql.upload(
+            id="file-mime123",
+            url="https://opencollective-production.s3.us-west-1.amazonaws.com/mime123.png",
+            name="image.png",
+            type="image/png",
+            size=16,
         )
 
         file_obj = BytesIO(b"fake png content")
@@ -566,30 +647,16 @@ class TestUploadFile:
         assert result["type"] == "image/png"
         assert result["name"] == "image.png"
 
-        request = responses.calls[0].request
+        request = rsps.calls[0].request
         assert b"image/png" in request.body
 
 
 class TestGetMe:
     """Tests for get_me method."""
 
-    @responses.activate
-    def test_get_me(self, client):
+    def test_get_me(self, rsps, client, mock_graphql):
         """Can get current authenticated user."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "me": {
-                        "id": "user-abc123",
-                        "slug": "max-ghenis",
-                        "name": "Max Ghenis",
-                    }
-                }
-            },
-            status=200,
-        )
+        mock_graphql.me(id="user-abc123", name="Max Ghenis")
 
         me = client.get_me()
 
@@ -597,358 +664,197 @@ class TestGetMe:
         assert me["slug"] == "max-ghenis"
         assert me["name"] == "Max Ghenis"
 
+        # Queries without variables do not send an empty variables object
+        assert "variables" not in body_json(rsps.calls[0])
 
-class TestDeleteExpense:
-    """Tests for delete_expense method."""
+    def test_get_me_is_cached(self, rsps, client, mock_graphql):
+        """Repeated get_me calls only hit the API once."""
+        mock_graphql.me(id="user-abc123")
 
-    @responses.activate
-    def test_delete_expense(self, client):
-        """Can delete a draft/pending expense."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "deleteExpense": {
-                        "id": "exp-abc123",
-                        "legacyId": 12345,
-                    }
-                }
-            },
-            status=200,
-        )
+        first = client.get_me()
+        second = client.get_me()
 
-        result = client.delete_expense("exp-abc123")
+        assert first == second
+        assert len(rsps.calls) == 1
 
-        assert result["id"] == "exp-abc123"
-        assert result["legacyId"] == 12345
+    def test_repeated_submissions_resolve_payee_once(self, rsps, client, mock_graphql):
+        """The payee and payout method lookup is reused across submissions."""
+        first = mock_graphql.submit_flow(uploads=0, legacyId=1)
+        second = mock_graphql.create_expense(legacyId=2)
 
+        results = [
+            client.submit_invoice(
+                collective_slug="policyengine",
+                description="Consulting",
+                amount_cents=10000,
+            )
+            for _ in range(2)
+        ]
+
+        assert [r["legacyId"] for r in results] == [1, 2]
+        lookups = [c for c in rsps.calls if "payoutMethods" in graphql_query(c)]
+        assert len(lookups) == 1
+        rsps.assert_call_count(API_URL, 3)
+        assert first.call_count == second.call_count == 1
+
+    def test_payout_methods_cache_expires(
+        self, rsps, client, mock_graphql, monkeypatch
+    ):
+        """Payout methods are fetched again once the TTL has passed."""
+        monkeypatch.setattr("opencollective.client.PAYOUT_METHODS_TTL", 0)
+        mock_graphql.payout_methods()
+        mock_graphql.payout_methods([{"id": "pm-new"}])
+
+        client.get_payout_methods("max-ghenis")
+        methods = client.get_payout_methods("max-ghenis")
 
-class TestSubmitReimbursement:
-    """Tests for submit_reimbursement high-level method."""
+        assert methods == [{"id": "pm-new"}]
+        assert len(rsps.calls) == 2
 
-    @responses.activate
-    def test_submit_reimbursement_with_pdf(self, client):
-        """Can submit reimbursement with PDF receipt."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={"data": {"me": {"id": "user-123", "slug": "max-ghenis"}}},
-            status=200,
-        )
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "account": {
-                        "payoutMethods": [{"id": "pm-123", "type": "BANK_ACCOUNT"}]
-                    }
-                }
-            },
-            status=200,
-        )
-        responses.add(
-            responses.POST,
-            UPLOAD_URL,
-            json={
-                "data": {
-                    "uploadFile": [
-                        {
-                            "file": {
-                                "id": "file-123",
-                                "url": "https://example.com/receipt.pdf",
-                            }
-                        }
-                    ]
-                }
-            },
-            status=200,
-        )
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "createExpense": {
-                        "id": "exp-123",
-                        "legacyId": 99999,
-                        "status": "PENDING",
-                    }
-                }
-            },
-            status=200,
+    def test_auth_error_clears_cache(self, client, mock_graphql):
+        """A rejected token drops the cached identity."""
+        mock_graphql.me()
+        client.get_me()
+        mock_graphql.errors("Unauthorized", code="UNAUTHORIZED")
+
+        with pytest.raises(Exception, match="Unauthorized"):
+            client.delete_expense("exp-123")
+
+        assert client._me_cache is None
+
+    def test_get_me_with_payout_methods(self, rsps, client, mock_graphql):
+        """Fetches the user and payout methods in one request."""
+        mock_graphql.me(
+            id="user-abc123",
+            name="Max Ghenis",
+            payoutMethods=[{"id": "pm-1", "type": "PAYPAL"}],
         )
 
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            f.write(b"fake pdf content")
-            temp_path = f.name
+        me, methods = client.get_me_with_payout_methods()
 
-        try:
-            result = client.submit_reimbursement(
-                collective_slug="policyengine",
-                description="Test expense",
-                amount_cents=10000,
-                receipt_file=temp_path,
-                tags=["test"],
-            )
+        assert me == {"id": "user-abc123", "slug": "max-ghenis", "name": "Max Ghenis"}
+        assert methods == [{"id": "pm-1", "type": "PAYPAL"}]
+        assert client.get_me() is me
+        assert len(rsps.calls) == 1
 
-            assert result["legacyId"] == 99999
-            assert result["status"] == "PENDING"
-        finally:
-            os.unlink(temp_path)
 
-    @responses.activate
-    def test_submit_reimbursement_with_explicit_payee(self, client):
-        """Can submit reimbursement with explicit payee slug."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "account": {"payoutMethods": [{"id": "pm-456", "type": "PAYPAL"}]}
-                }
-            },
-            status=200,
-        )
-        responses.add(
-            responses.POST,
-            UPLOAD_URL,
-            json={
-                "data": {
-                    "uploadFile": [
-                        {"file": {"id": "f1", "url": "https://example.com/r.pdf"}}
-                    ]
-                }
-            },
-            status=200,
-        )
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "createExpense": {"id": "e1", "legacyId": 111, "status": "PENDING"}
-                }
-            },
-            status=200,
-        )
+class TestDeleteExpense:
+    """Tests for delete_expense method."""
 
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            f.write(b"pdf")
-            temp_path = f.name
+    def test_delete_expense(self, client, mock_graphql):
+        """Can delete a draft/pending expense."""
+        mock_graphql.delete_expense(id="exp-abc123", legacyId=12345)
 
-        try:
-            result = client.submit_reimbursement(
-                collective_slug="policyengine",
-                description="Test",
-                amount_cents=5000,
-                receipt_file=temp_path,
-                payee_slug="explicit-user",
-            )
-            assert result["legacyId"] == 111
-        finally:
-            os.unlink(temp_path)
+        result = client.delete_expense("exp-abc123")
 
+        assert result["id"] == "exp-abc123"
+        assert result["legacyId"] == 12345
 
-class TestCurrencySupport:
-    """Tests for multi-currency expense support."""
 
-    @responses.activate
-    def test_create_expense_with_currency(self, client):
-        """Can create an expense with explicit currency."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "createExpense": {
-                        "id": "exp-gbp",
-                        "legacyId": 200,
-                        "description": "GCP Cloud Services",
-                        "amount": 205895,
-                        "status": "DRAFT",
-                    }
-                }
-            },
-            status=200,
+class TestSubmitReimbursement:
+    """Tests for submit_reimbursement high-level method."""
+
+    def test_submit_reimbursement_with_pdf(self, ordered_rsps, client, sample_pdf):
+        """Can submit reimbursement with PDF receipt."""
+        register_sequence(
+            ordered_rsps,
+            [
+                (API_URL, ME_BODY),
+                (UPLOAD_URL, UPLOAD_BODY),
+                (
+                    API_URL,
+                    {
+                        "createExpense": {
+                            "id": "exp-123",
+                            "legacyId": 99999,
+                            "status": "PENDING",
+                        }
+                    },
+                ),
+            ],
         )
 
-        result = client.create_expense(
+        result = client.submit_reimbursement(
             collective_slug="policyengine",
-            payee_slug="max-ghenis",
-            description="GCP Cloud Services",
-            amount_cents=205895,
-            currency="GBP",
-            tags=["gcp", "infrastructure"],
+            description="Test expense",
+            amount_cents=10000,
+            receipt_file=sample_pdf,
+            tags=["test"],
         )
 
-        assert result["description"] == "GCP Cloud Services"
-        assert result["status"] == "DRAFT"
+        assert result["legacyId"] == 99999
+        assert result["status"] == "PENDING"
 
-        request_body = responses.calls[0].request.body.decode()
-        assert '"currency":"GBP"' in request_body.replace(" ", "")
-
-    @responses.activate
-    def test_create_expense_without_currency_omits_field(self, client):
-        """Currency field is omitted when not provided (uses collective default)."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "createExpense": {
-                        "id": "exp-usd",
-                        "legacyId": 201,
-                        "description": "Test",
-                        "amount": 1000,
-                        "status": "DRAFT",
-                    }
-                }
-            },
-            status=200,
-        )
+    def test_submit_reimbursement_with_explicit_payee(
+        self, client, mock_graphql, sample_pdf
+    ):
+        """Can submit reimbursement with explicit payee slug."""
+        mock_graphql.payout_methods([{"id": "pm-456", "type": "PAYPAL"}])
+        mock_graphql.upload()
+        mock_graphql.create_expense(id="e1", legacyId=111)
 
-        client.create_expense(
+        result = client.submit_reimbursement(
             collective_slug="policyengine",
-            payee_slug="max-ghenis",
             description="Test",
-            amount_cents=1000,
-        )
-
-        request_body = responses.calls[0].request.body.decode()
-        no_currency = '"currency"' not in request_body
-        null_currency = '"currency":null' in request_body.replace(" ", "")
-        assert no_currency or null_currency
-
-    @responses.activate
-    def test_submit_reimbursement_with_currency(self, client):
-        """Can submit reimbursement with explicit currency."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={"data": {"me": {"id": "user-123", "slug": "max-ghenis"}}},
-            status=200,
-        )
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "account": {
-                        "payoutMethods": [{"id": "pm-123", "type": "BANK_ACCOUNT"}]
-                    }
-                }
-            },
-            status=200,
-        )
-        responses.add(
-            responses.POST,
-            UPLOAD_URL,
-            json={
-                "data": {
-                    "uploadFile": [
-                        {"file": {"id": "f1", "url": "https://example.com/r.pdf"}}
-                    ]
-                }
-            },
-            status=200,
-        )
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "createExpense": {
-                        "id": "exp-gbp",
-                        "legacyId": 202,
-                        "status": "PENDING",
-                    }
-                }
-            },
-            status=200,
+            amount_cents=5000,
+            receipt_file=sample_pdf,
+            payee_slug="explicit-user",
         )
+        assert result["legacyId"] == 111
 
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            f.write(b"fake pdf")
-            temp_path = f.name
 
-        try:
-            result = client.submit_reimbursement(
-                collective_slug="policyengine",
-                description="GCP Jan 2026",
-                amount_cents=205895,
-                receipt_file=temp_path,
-                currency="GBP",
-                tags=["gcp"],
-            )
-            assert result["legacyId"] == 202
-
-            create_request = responses.calls[3].request.body.decode()
-            assert '"currency":"GBP"' in create_request.replace(" ", "")
-        finally:
-            os.unlink(temp_path)
-
-    @responses.activate
-    def test_submit_invoice_with_currency(self, client):
-        """Can submit invoice with explicit currency."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={"data": {"me": {"slug": "max-ghenis"}}},
-            status=200,
-        )
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={"data": {"account": {"payoutMethods": [{"id": "pm-1"}]}}},
-            status=200,
-        )
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "createExpense": {
-                        "id": "inv-gbp",
-                        "legacyId": 203,
-                        "status": "PENDING",
-                    }
-                }
-            },
-            status=200,
-        )
+class TestCurrencySupport:
+    """Tests for multi-currency expense support."""
 
-        result = client.submit_invoice(
+    @pytest.mark.parametrize(
+        "method, currency",
+        [
+            ("create_expense", "GBP"),
+            ("create_expense", None),
+            ("submit_reimbursement", "GBP"),
+            ("submit_reimbursement", None),
+            ("submit_invoice", "EUR"),
+            ("submit_invoice", None),
+        ],
+    )
+    def test_currency_propagation(
+        self, ordered_rsps, client, sample_pdf, method, currency
+    ):
+        """Currency is sent when given and omitted otherwise (collective default)."""
+        lookup = (API_URL, ME_BODY)
+        created = (API_URL, {"createExpense": {"id": "exp-cur", "legacyId": 202}})
+        steps, kwargs = {
+            "create_expense": ([created], {"payee_slug": "max-ghenis"}),
+            "submit_reimbursement": (
+                [lookup, (UPLOAD_URL, UPLOAD_BODY), created],
+                {"receipt_file": sample_pdf},
+            ),
+            "submit_invoice": ([lookup, created], {}),
+        }[method]
+        register_sequence(ordered_rsps, steps)
+        if currency:
+            kwargs["currency"] = currency
+
+        result = getattr(client, method)(
             collective_slug="policyengine",
-            description="EUR Consulting",
-            amount_cents=500000,
-            currency="EUR",
+            description="GCP Jan 2026",
+            amount_cents=205895,
+            **kwargs,
         )
 
-        assert result["legacyId"] == 203
-
-        create_request = responses.calls[2].request.body.decode()
-        assert '"currency":"EUR"' in create_request.replace(" ", "")
+        assert result["legacyId"] == 202
+        assert_graphql_variables(
+            ordered_rsps.calls[-1], **{"expense.currency": currency or MISSING}
+        )
 
-    @responses.activate
-    def test_create_expense_with_incurred_at(self, client):
+    def test_create_expense_with_incurred_at(self, rsps, client, mock_graphql):
         """Can create an expense with incurredAt date on items."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "createExpense": {
-                        "id": "exp-dated",
-                        "legacyId": 204,
-                        "description": "GCP Jan 2026",
-                        "amount": 205895,
-                        "status": "DRAFT",
-                    }
-                }
-            },
-            status=200,
+        mock_graphql.create_expense(
+            id="exp-dated",
+            legacyId=204,
+            description="GCP Jan 2026",
+            amount=205895,
+            status="DRAFT",
         )
 
         result = client.create_expense(
@@ -962,110 +868,38 @@ class TestCurrencySupport:
 
         assert result["legacyId"] == 204
 
-        request_body = responses.calls[0].request.body.decode()
-        assert "2026-01-31" in request_body
-
-    @responses.activate
-    def test_submit_reimbursement_with_incurred_at(self, client):
-        """Can submit reimbursement with incurredAt date."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={"data": {"me": {"id": "user-123", "slug": "max-ghenis"}}},
-            status=200,
-        )
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "account": {
-                        "payoutMethods": [{"id": "pm-123", "type": "BANK_ACCOUNT"}]
-                    }
-                }
-            },
-            status=200,
-        )
-        responses.add(
-            responses.POST,
-            UPLOAD_URL,
-            json={
-                "data": {
-                    "uploadFile": [
-                        {"file": {"id": "f1", "url": "https://example.com/r.pdf"}}
-                    ]
-                }
-            },
-            status=200,
-        )
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "createExpense": {
-                        "id": "exp-dated",
-                        "legacyId": 205,
-                        "status": "PENDING",
-                    }
-                }
-            },
-            status=200,
+        assert_graphql_variables(
+            rsps.calls[0], **{"expense.items.0.incurredAt": "2026-01-31T00:00:00Z"}
         )
 
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            f.write(b"fake pdf")
-            temp_path = f.name
+    def test_submit_reimbursement_with_incurred_at(
+        self, rsps, client, mock_graphql, sample_pdf
+    ):
+        """Can submit reimbursement with incurredAt date."""
+        create = mock_graphql.submit_flow(id="exp-dated", legacyId=205)
 
-        try:
-            result = client.submit_reimbursement(
-                collective_slug="policyengine",
-                description="GCP Jan 2026",
-                amount_cents=205895,
-                receipt_file=temp_path,
-                currency="GBP",
-                incurred_at="2026-01-31",
-            )
-            assert result["legacyId"] == 205
+        result = client.submit_reimbursement(
+            collective_slug="policyengine",
+            description="GCP Jan 2026",
+            amount_cents=205895,
+            receipt_file=sample_pdf,
+            currency="GBP",
+            incurred_at="2026-01-31",
+        )
+        assert result["legacyId"] == 205
 
-            create_request = responses.calls[3].request.body.decode()
-            assert "2026-01-31" in create_request
-        finally:
-            os.unlink(temp_path)
+        (create_call,) = create.calls
+        assert_graphql_variables(
+            create_call, **{"expense.items.0.incurredAt": "2026-01-31T00:00:00Z"}
+        )
 
 
 class TestSubmitInvoice:
     """Tests for submit_invoice high-level method."""
 
-    @responses.activate
-    def test_submit_invoice_without_file(self, client):
+    def test_submit_invoice_without_file(self, client, mock_graphql):
         """Can submit invoice without file attachment."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={"data": {"me": {"slug": "max-ghenis"}}},
-            status=200,
-        )
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={"data": {"account": {"payoutMethods": [{"id": "pm-1"}]}}},
-            status=200,
-        )
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "createExpense": {
-                        "id": "inv-1",
-                        "legacyId": 222,
-                        "status": "PENDING",
-                    }
-                }
-            },
-            status=200,
-        )
+        mock_graphql.submit_flow(uploads=0, id="inv-1", legacyId=222)
 
         result = client.submit_invoice(
             collective_slug="policyengine",
@@ -1077,544 +911,284 @@ class TestSubmitInvoice:
         assert result["legacyId"] == 222
         assert result["status"] == "PENDING"
 
-    @responses.activate
-    def test_submit_invoice_with_file(self, client):
+    def test_submit_invoice_with_file(self, client, mock_graphql, sample_invoice_pdf):
         """Can submit invoice with file attachment."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={"data": {"me": {"slug": "test-user"}}},
-            status=200,
-        )
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={"data": {"account": {"payoutMethods": [{"id": "pm-2"}]}}},
-            status=200,
-        )
-        responses.add(
-            responses.POST,
-            UPLOAD_URL,
-            json={
-                "data": {
-                    "uploadFile": [{"file": {"url": "https://example.com/invoice.pdf"}}]
-                }
-            },
-            status=200,
-        )
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "createExpense": {"id": "inv-2", "legacyId": 333, "status": "DRAFT"}
-                }
-            },
-            status=200,
+        mock_graphql.submit_flow(id="inv-2", legacyId=333, status="DRAFT")
+
+        result = client.submit_invoice(
+            collective_slug="policyengine",
+            description="Invoice with file",
+            amount_cents=100000,
+            invoice_file=sample_invoice_pdf,
         )
+        assert result["legacyId"] == 333
 
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            f.write(b"invoice pdf")
-            temp_path = f.name
 
-        try:
-            result = client.submit_invoice(
-                collective_slug="policyengine",
-                description="Invoice with file",
-                amount_cents=100000,
-                invoice_file=temp_path,
-            )
-            assert result["legacyId"] == 333
-        finally:
-            os.unlink(temp_path)
-
-
-class TestGetExpensesStatusFix:
-    """Tests for fix #1: get_expenses status type should be array."""
-
-    @responses.activate
-    def test_get_expenses_status_variable_type_is_array(self, client):
-        """GraphQL query should use [ExpenseStatusFilter] array type."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "expenses": {
-                        "totalCount": 1,
-                        "nodes": [
-                            {
-                                "id": "exp1",
-                                "legacyId": 100,
-                                "description": "Test",
-                                "amount": 5000,
-                                "currency": "USD",
-                                "type": "RECEIPT",
-                                "status": "PENDING",
-                                "createdAt": "2026-01-01T00:00:00Z",
-                                "payee": {"name": "Test User", "slug": "test-user"},
-                                "tags": [],
-                                "items": [],
-                            }
-                        ],
-                    }
-                }
-            },
-            status=200,
-        )
+class TestGetExpensesQuery:
+    """Tests for the shape of the get_expenses query (status filter, items)."""
 
-        client.get_expenses("test-collective", status="PENDING")
+    @pytest.mark.parametrize(
+        "status, expected",
+        [("PENDING", ["PENDING"]), ("APPROVED", ["APPROVED"]), (None, MISSING)],
+    )
+    def test_status_filter(self, rsps, client, mock_graphql, status, expected):
+        """A status is sent as a single-element [ExpenseStatusFilter] array."""
+        mock_graphql.expenses()
+
+        client.get_expenses("test-collective", status=status)
 
-        request_body = responses.calls[0].request.body.decode()
         # The variable type declaration must use array syntax
-        assert "[ExpenseStatusFilter]" in request_body
-
-    @responses.activate
-    def test_get_expenses_status_sent_as_array(self, client):
-        """When a status is provided, it should be sent as a single-element array."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "expenses": {
-                        "totalCount": 0,
-                        "nodes": [],
-                    }
-                }
-            },
-            status=200,
-        )
+        assert "$status: [ExpenseStatusFilter]" in graphql_query(rsps.calls[0])
+        assert_graphql_variables(rsps.calls[0], status=expected)
 
-        client.get_expenses("test-collective", status="APPROVED")
-
-        import json as json_mod
-
-        request_body = json_mod.loads(responses.calls[0].request.body.decode())
-        # The status variable must be a list
-        assert isinstance(request_body["variables"]["status"], list)
-        assert request_body["variables"]["status"] == ["APPROVED"]
-
-
-class TestGetExpensesItems:
-    """Tests for fix #3: get_expenses should include items in the response."""
-
-    @responses.activate
-    def test_get_expenses_includes_items_in_query(self, client):
-        """Query should request items with standard fields."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "expenses": {
-                        "totalCount": 1,
-                        "nodes": [
-                            {
-                                "id": "exp1",
-                                "legacyId": 100,
-                                "description": "Cloud hosting",
-                                "amount": 15000,
-                                "currency": "USD",
-                                "type": "RECEIPT",
-                                "status": "PAID",
-                                "createdAt": "2026-01-15T00:00:00Z",
-                                "payee": {"name": "Dev", "slug": "dev"},
-                                "tags": ["hosting"],
-                                "items": [
-                                    {
-                                        "id": "item1",
-                                        "description": "January hosting",
-                                        "amount": 15000,
-                                        "url": "https://example.com/receipt.pdf",
-                                        "incurredAt": "2026-01-15T00:00:00Z",
-                                    }
-                                ],
-                            }
-                        ],
-                    }
-                }
-            },
-            status=200,
-        )
+    def test_items_requested_and_returned(self, rsps, client, mock_graphql):
+        """Items are requested with their standard fields and passed through."""
+        mock_graphql.expenses([_EXPENSE_WITH_ITEMS])
 
         result = client.get_expenses("test-collective")
 
-        # The query must include items subfields
-        request_body = responses.calls[0].request.body.decode()
-        assert "items" in request_body
-
-        # The response should contain items
-        expense = result["nodes"][0]
-        assert "items" in expense
-        assert len(expense["items"]) == 1
-        assert expense["items"][0]["id"] == "item1"
-        assert expense["items"][0]["description"] == "January hosting"
-        assert expense["items"][0]["amount"] == 15000
-
-    @responses.activate
-    def test_get_expenses_items_fields_in_query(self, client):
-        """Items subquery includes all required fields."""
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "expenses": {
-                        "totalCount": 0,
-                        "nodes": [],
-                    }
-                }
-            },
-            status=200,
-        )
-
-        client.get_expenses("test-collective")
-
-        request_body = responses.calls[0].request.body.decode()
-        # Verify the query requests all required item fields
-        assert "items" in request_body
-        # Check that the query includes the expected subfields for items
-        # These should appear in the query string after "items {"
-        for field in ["id", "description", "amount", "url", "incurredAt"]:
-            assert field in request_body
+        items_fields = selection_fields(graphql_query(rsps.calls[0]), "items")
+        assert items_fields >= {"id", "description", "amount", "url", "incurredAt"}
+        assert result["nodes"][0]["items"] == _EXPENSE_WITH_ITEMS["items"]
 
 
 class TestSubmitMultiItemReimbursement:
     """Tests for feature #2: submit_multi_item_reimbursement method."""
 
-    @responses.activate
-    def test_submit_multi_item_reimbursement_basic(self, client):
+    def test_submit_multi_item_reimbursement_basic(
+        self, rsps, client, mock_graphql, sample_receipts
+    ):
         """Can submit a reimbursement with multiple items and receipts."""
-        # Mock get_me
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={"data": {"me": {"id": "user-123", "slug": "max-ghenis"}}},
-            status=200,
-        )
-        # Mock get_payout_methods
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "account": {
-                        "payoutMethods": [{"id": "pm-123", "type": "BANK_ACCOUNT"}]
-                    }
-                }
-            },
-            status=200,
-        )
-        # Mock two file uploads (one per item)
-        responses.add(
-            responses.POST,
-            UPLOAD_URL,
-            json={
-                "data": {
-                    "uploadFile": [
-                        {
-                            "file": {
-                                "id": "file-1",
-                                "url": "https://example.com/receipt1.pdf",
-                            }
-                        }
-                    ]
-                }
-            },
-            status=200,
-        )
-        responses.add(
-            responses.POST,
-            UPLOAD_URL,
-            json={
-                "data": {
-                    "uploadFile": [
-                        {
-                            "file": {
-                                "id": "file-2",
-                                "url": "https://example.com/receipt2.pdf",
-                            }
-                        }
-                    ]
-                }
-            },
-            status=200,
-        )
-        # Mock createExpense
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "createExpense": {
-                        "id": "exp-multi",
-                        "legacyId": 50000,
-                        "description": "Conference travel",
-                        "amount": 75000,
-                        "status": "PENDING",
-                    }
-                }
-            },
-            status=200,
+        # One upload per item
+        create = mock_graphql.submit_flow(
+            uploads=2,
+            id="exp-multi",
+            legacyId=50000,
+            description="Conference travel",
+            amount=75000,
         )
 
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f1:
-            f1.write(b"receipt 1 pdf")
-            path1 = f1.name
+        result = client.submit_multi_item_reimbursement(
+            collective_slug="policyengine",
+            description="Conference travel",
+            items=[
+                {
+                    "amount_cents": 50000,
+                    "description": "Flight ticket",
+                    "receipt_file": sample_receipts[0],
+                    "incurred_at": "2026-03-01",
+                },
+                {
+                    "amount_cents": 25000,
+                    "description": "Hotel stay",
+                    "receipt_file": sample_receipts[1],
+                    "incurred_at": "2026-03-02",
+                },
+            ],
+            tags=["travel", "conference"],
+        )
 
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f2:
-            f2.write(b"receipt 2 pdf")
-            path2 = f2.name
+        assert result["legacyId"] == 50000
+        assert result["status"] == "PENDING"
 
-        try:
-            result = client.submit_multi_item_reimbursement(
-                collective_slug="policyengine",
-                description="Conference travel",
-                items=[
-                    {
-                        "amount_cents": 50000,
-                        "description": "Flight ticket",
-                        "receipt_file": path1,
-                        "incurred_at": "2026-03-01",
-                    },
-                    {
-                        "amount_cents": 25000,
-                        "description": "Hotel stay",
-                        "receipt_file": path2,
-                        "incurred_at": "2026-03-02",
-                    },
-                ],
-                tags=["travel", "conference"],
-            )
+        # Verify the createExpense request has two items
+        (create_call,) = create.calls
+        assert_graphql_variables(
+            create_call,
+            **{
+                "expense.items.0.description": "Flight ticket",
+                "expense.items.0.amount": 50000,
+                "expense.items.1.description": "Hotel stay",
+                "expense.items.1.amount": 25000,
+                "expense.items.2": MISSING,
+                "expense.type": "RECEIPT",
+            },
+        )
 
-            assert result["legacyId"] == 50000
-            assert result["status"] == "PENDING"
-
-            # Verify the createExpense request has two items
-            import json as json_mod
-
-            create_request = json_mod.loads(responses.calls[4].request.body.decode())
-            expense_input = create_request["variables"]["expense"]
-            assert len(expense_input["items"]) == 2
-            assert expense_input["items"][0]["description"] == "Flight ticket"
-            assert expense_input["items"][0]["amount"] == 50000
-            assert expense_input["items"][1]["description"] == "Hotel stay"
-            assert expense_input["items"][1]["amount"] == 25000
-            assert expense_input["type"] == "RECEIPT"
-        finally:
-            os.unlink(path1)
-            os.unlink(path2)
-
-    @responses.activate
-    def test_submit_multi_item_with_explicit_payee(self, client):
+    def test_submit_multi_item_with_explicit_payee(
+        self, client, mock_graphql, sample_pdf
+    ):
         """Can submit multi-item reimbursement with explicit payee and payout method."""
         # No get_me or get_payout_methods needed when both are provided
-        # Mock file upload
-        responses.add(
-            responses.POST,
-            UPLOAD_URL,
-            json={
-                "data": {
-                    "uploadFile": [
-                        {"file": {"id": "f1", "url": "https://example.com/r.pdf"}}
-                    ]
-                }
-            },
-            status=200,
+        mock_graphql.upload()
+        mock_graphql.create_expense(id="exp-explicit", legacyId=50001)
+
+        result = client.submit_multi_item_reimbursement(
+            collective_slug="policyengine",
+            description="Single item multi method",
+            items=[
+                {
+                    "amount_cents": 10000,
+                    "description": "Software license",
+                    "receipt_file": sample_pdf,
+                    "incurred_at": "2026-02-01",
+                },
+            ],
+            payee_slug="explicit-user",
+            payout_method_id="pm-456",
         )
-        # Mock createExpense
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "createExpense": {
-                        "id": "exp-explicit",
-                        "legacyId": 50001,
-                        "status": "PENDING",
-                    }
-                }
-            },
-            status=200,
+        assert result["legacyId"] == 50001
+
+    def test_submit_multi_item_with_currency(self, client, mock_graphql, sample_pdf):
+        """Can submit multi-item reimbursement with explicit currency."""
+        mock_graphql.submit_flow(
+            variables={"expense": {"currency": "GBP"}},
+            id="exp-gbp-multi",
+            legacyId=50002,
         )
 
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            f.write(b"receipt pdf")
-            path = f.name
+        result = client.submit_multi_item_reimbursement(
+            collective_slug="policyengine",
+            description="GBP expense",
+            items=[
+                {
+                    "amount_cents": 5000,
+                    "description": "UK purchase",
+                    "receipt_file": sample_pdf,
+                    "incurred_at": "2026-01-15",
+                },
+            ],
+            currency="GBP",
+        )
+        assert result["legacyId"] == 50002
 
-        try:
-            result = client.submit_multi_item_reimbursement(
+    def test_submit_multi_item_rejects_incomplete_items(self, rsps, client):
+        """Items missing required keys fail before anything is uploaded."""
+        with pytest.raises(ValueError, match="Item 1 is missing .*receipt_file"):
+            client.submit_multi_item_reimbursement(
                 collective_slug="policyengine",
-                description="Single item multi method",
+                description="Incomplete",
                 items=[
-                    {
-                        "amount_cents": 10000,
-                        "description": "Software license",
-                        "receipt_file": path,
-                        "incurred_at": "2026-02-01",
-                    },
+                    {"amount_cents": 100, "description": "A", "receipt_file": "a"},
+                    {"amount_cents": 100, "description": "B"},
                 ],
-                payee_slug="explicit-user",
-                payout_method_id="pm-456",
+                payee_slug="max-ghenis",
+                payout_method_id="pm-1",
             )
-            assert result["legacyId"] == 50001
-        finally:
-            os.unlink(path)
 
-    @responses.activate
-    def test_submit_multi_item_with_currency(self, client):
-        """Can submit multi-item reimbursement with explicit currency."""
-        # Mock get_me
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={"data": {"me": {"slug": "max-ghenis"}}},
-            status=200,
-        )
-        # Mock get_payout_methods
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={"data": {"account": {"payoutMethods": [{"id": "pm-1"}]}}},
-            status=200,
+        assert len(rsps.calls) == 0
+
+    def test_submit_multi_item_uploads_each_receipt(
+        self, rsps, client, mock_graphql, sample_receipts
+    ):
+        """Each item's receipt_file should be uploaded separately."""
+        mock_graphql.submit_flow(uploads=3, id="exp-3items", legacyId=50003)
+
+        items = [
+            {
+                "amount_cents": 1000 * (i + 1),
+                "description": f"Item {i + 1}",
+                "receipt_file": path,
+                "incurred_at": f"2026-01-0{i + 1}",
+            }
+            for i, path in enumerate(sample_receipts)
+        ]
+
+        result = client.submit_multi_item_reimbursement(
+            collective_slug="policyengine",
+            description="Three items",
+            items=items,
         )
-        # Mock file upload
-        responses.add(
-            responses.POST,
-            UPLOAD_URL,
-            json={
-                "data": {
-                    "uploadFile": [
-                        {"file": {"id": "f1", "url": "https://example.com/r.pdf"}}
-                    ]
-                }
-            },
-            status=200,
+
+        assert result["legacyId"] == 50003
+        # 1 lookup (me with payout methods) + 1 create, and one upload per item
+        rsps.assert_call_count(API_URL, 2)
+        rsps.assert_call_count(UPLOAD_URL, 3)
+
+    def test_submit_multi_item_keeps_receipts_in_item_order(
+        self, rsps, client, mock_graphql, sample_receipts
+    ):
+        """Concurrent uploads are matched back to the item they belong to."""
+
+        def upload_callback(request):
+            name = re.search(rb'filename="(receipt\d)\.pdf"', request.body).group(1)
+            url = f"https://example.com/{name.decode()}.pdf"
+            body = {"data": {"uploadFile": [{"file": {"id": "f", "url": url}}]}}
+            return 200, {}, json.dumps(body)
+
+        rsps.add_callback("POST", UPLOAD_URL, callback=upload_callback)
+        create = mock_graphql.create_expense(id="exp-ordered", legacyId=50004)
+
+        client.submit_multi_item_reimbursement(
+            collective_slug="policyengine",
+            description="Ordered items",
+            items=[
+                {"amount_cents": 100, "description": f"Item {i}", "receipt_file": p}
+                for i, p in enumerate(sample_receipts)
+            ],
+            payee_slug="max-ghenis",
+            payout_method_id="pm-1",
         )
-        # Mock createExpense
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "createExpense": {
-                        "id": "exp-gbp-multi",
-                        "legacyId": 50002,
-                        "status": "PENDING",
-                    }
-                }
+
+        (create_call,) = create.calls
+        assert_graphql_variables(
+            create_call,
+            **{
+                f"expense.items.{i}.url": f"https://example.com/receipt{i}.pdf"
+                for i in range(3)
             },
-            status=200,
         )
 
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            f.write(b"pdf")
-            path = f.name
 
-        try:
-            result = client.submit_multi_item_reimbursement(
-                collective_slug="policyengine",
-                description="GBP expense",
-                items=[
-                    {
-                        "amount_cents": 5000,
-                        "description": "UK purchase",
-                        "receipt_file": path,
-                        "incurred_at": "2026-01-15",
-                    },
-                ],
-                currency="GBP",
-            )
-            assert result["legacyId"] == 50002
+class TestHttpxTransport:
+    """Tests for the optional httpx transport."""
 
-            import json as json_mod
+    @pytest.fixture
+    def httpx_requests(self, monkeypatch):
+        """Route httpx clients through a mock transport; yield the requests sent."""
+        httpx = pytest.importorskip("httpx")
+        sent = []
 
-            create_request = json_mod.loads(responses.calls[3].request.body.decode())
-            assert create_request["variables"]["expense"].get("currency") == "GBP"
-        finally:
-            os.unlink(path)
+        def handler(request):
+            request.read()
+            sent.append(request)
+            if request.url == UPLOAD_URL:
+                return httpx.Response(200, content=UPLOAD_BODY)
+            return httpx.Response(200, json={"data": {"collective": {"slug": "pe"}}})
 
-    @responses.activate
-    def test_submit_multi_item_uploads_each_receipt(self, client):
-        """Each item's receipt_file should be uploaded separately."""
-        # Mock get_me
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={"data": {"me": {"slug": "test-user"}}},
-            status=200,
-        )
-        # Mock get_payout_methods
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={"data": {"account": {"payoutMethods": [{"id": "pm-1"}]}}},
-            status=200,
-        )
-        # Mock 3 file uploads
-        for i in range(3):
-            responses.add(
-                responses.POST,
-                UPLOAD_URL,
-                json={
-                    "data": {
-                        "uploadFile": [
-                            {
-                                "file": {
-                                    "id": f"file-{i}",
-                                    "url": f"https://example.com/receipt{i}.pdf",
-                                }
-                            }
-                        ]
-                    }
-                },
-                status=200,
-            )
-        # Mock createExpense
-        responses.add(
-            responses.POST,
-            API_URL,
-            json={
-                "data": {
-                    "createExpense": {
-                        "id": "exp-3items",
-                        "legacyId": 50003,
-                        "status": "PENDING",
-                    }
-                }
-            },
-            status=200,
+        real_client = httpx.Client
+        monkeypatch.setattr(
+            httpx,
+            "Client",
+            lambda **kwargs: real_client(
+                transport=httpx.MockTransport(handler), **kwargs
+            ),
         )
+        return sent
 
-        temp_paths = []
-        try:
-            items = []
-            for i in range(3):
-                with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-                    f.write(f"receipt {i}".encode())
-                    temp_paths.append(f.name)
-                    items.append(
-                        {
-                            "amount_cents": 1000 * (i + 1),
-                            "description": f"Item {i + 1}",
-                            "receipt_file": f.name,
-                            "incurred_at": f"2026-01-0{i + 1}",
-                        }
-                    )
+    def test_graphql_request_uses_httpx(self, httpx_requests):
+        """GraphQL requests carry the session headers and a JSON body."""
+        client = OpenCollectiveClient(access_token="test_token", transport="httpx")
 
-            result = client.submit_multi_item_reimbursement(
-                collective_slug="policyengine",
-                description="Three items",
-                items=items,
-            )
+        assert client.get_collective("pe") == {"slug": "pe"}
+
+        (request,) = httpx_requests
+        assert request.headers["Authorization"] == "Bearer test_token"
+        assert request.headers["Content-Type"] == "application/json"
+        assert _json.loads(request.content)["variables"] == {"slug": "pe"}
+
+    def test_upload_streams_with_content_length(self, httpx_requests):
+        """Multipart uploads are streamed with an exact Content-Length."""
+        client = OpenCollectiveClient(access_token="test_token", transport="httpx")
+        content = bytes(range(256)) * 512
+
+        result = client.upload_file(BytesIO(content), filename="scan.pdf")
+
+        assert result["url"] == "https://example.com/receipt.pdf"
+        (request,) = httpx_requests
+        assert request.headers["Authorization"] == "Bearer test_token"
+        assert int(request.headers["Content-Length"]) == len(request.content)
+        assert request.headers["Content-Type"].startswith("multipart/form-data")
+        assert content + b"\r\n--" in request.content
+
+    def test_httpx_not_installed(self, monkeypatch):
+        """Raises ImportError with install instructions when httpx is missing."""
+        monkeypatch.setitem(sys.modules, "httpx", None)
+
+        with pytest.raises(ImportError, match=r"opencollective\[http2\]"):
+            OpenCollectiveClient(access_token="test_token", transport="httpx")
 
-            assert result["legacyId"] == 50003
-            # 2 API calls (get_me, get_payout) + 3 uploads + 1 create = 6
-            assert len(responses.calls) == 6
-            # Verify 3 upload calls went to UPLOAD_URL
-            upload_calls = [c for c in responses.calls if c.request.url == UPLOAD_URL]
-            assert len(upload_calls) == 3
-        finally:
-            for p in temp_paths:
-                os.unlink(p)
+    def test_unknown_transport(self):
+        """Raises ValueError for an unsupported transport name."""
+        with pytest.raises(ValueError, match="Unknown transport"):
+            OpenCollectiveClient(access_token="test_token", transport="urllib")